@@ -7,15 +7,16 @@
 # Date   : 15 June 2025
 #---------------------------------------------------------------------
 
-from rpi_hardware_pwm import HardwarePWM
 import time
 
+from backends.base import create_device
+
 class Led:
     def __init__(self, led_pin: int, default_brightness: int, chip: int):
         self.led_pin = led_pin
         self.default_brightness = default_brightness
         self.chip = chip
-        self.pwm = HardwarePWM(pwm_channel=self.led_pin, hz=10000, chip=self.chip)
+        self.pwm = create_device("pwm", self.led_pin, 10000, self.chip)
         self.pwm.start(0)
 
     def get_parameters(self):
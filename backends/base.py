@@ -0,0 +1,140 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# base.py
+# Device protocols and the registry of hardware/simulated backends
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import importlib
+import os
+from typing import Protocol, runtime_checkable
+
+# Backend used when none was set, "hardware" or "simulated"
+BACKEND_ENV_VAR = "SMART_NODE_BACKEND"
+BACKEND_DEFAULT = "hardware"
+
+# The drivers are written against the library APIs (smbus, spidev, gpiozero,
+# rpi_hardware_pwm, adafruit_dht, paho). The protocols below are the members
+# they use: the hardware backend hands out the library objects as they are
+# (i2c adds the plain read smbus lacks) and a simulated device provides the
+# same members. tests/test_backends.py checks the simulated backend
+class Bus(Protocol):
+    def close(self): ...
+
+# Grouping only, the sensor and actuator kinds share no members
+class Sensor(Protocol):
+    pass
+
+class Actuator(Protocol):
+    pass
+
+@runtime_checkable
+class I2CBus(Bus, Protocol):
+    def write_byte(self, address, value): ...
+    def read_byte(self, address): ...
+    def read_i2c_block_data(self, address, command, length): ...
+    # Plain read, no command byte in front
+    def read_bytes(self, address, length): ...
+
+# Already opened by the factory
+@runtime_checkable
+class SPIDevice(Bus, Protocol):
+    max_speed_hz: int
+    mode: int
+
+    def xfer2(self, data): ...
+    def writebytes2(self, data): ...
+
+@runtime_checkable
+class DigitalOutput(Actuator, Protocol):
+    def on(self): ...
+    def off(self): ...
+
+@runtime_checkable
+class DigitalInput(Sensor, Protocol):
+    is_active: bool
+    when_activated: object
+    when_deactivated: object
+
+@runtime_checkable
+class PWMOutput(Actuator, Protocol):
+    def start(self, duty_cycle): ...
+    def change_duty_cycle(self, duty_cycle): ...
+    def stop(self): ...
+
+# measure() raises RuntimeError on a bad read, then temperature and humidity hold it
+@runtime_checkable
+class HumiditySensor(Sensor, Protocol):
+    temperature: object
+    humidity: object
+
+    def measure(self): ...
+
+# paho.mqtt.client.Client, MQTTv5 callback signatures
+@runtime_checkable
+class MQTTClient(Protocol):
+    on_connect: object
+    on_publish: object
+    on_message: object
+    on_subscribe: object
+
+    def tls_set(self, **kwargs): ...
+    def username_pw_set(self, username, password): ...
+    def connect_async(self, host, port, keepalive): ...
+    def loop_start(self): ...
+    def subscribe(self, topic, qos): ...
+    def publish(self, topic, payload, qos): ...
+    def is_connected(self): ...
+
+# Device kinds, what create_device() passes to their factory and the
+# protocol of the returned object. pin numbers are GPIO numbers
+#   "i2c"       (bus_id)
+#   "spi"       (bus_id, chip_id)
+#   "gpio_out"  (pin)
+#   "gpio_in"   (pin, pull_up)
+#   "pwm"       (channel, hz, chip)
+#   "dht11"     (pin)
+#   "mqtt"      ()
+DEVICE_PROTOCOLS = {
+    "i2c": I2CBus,
+    "spi": SPIDevice,
+    "gpio_out": DigitalOutput,
+    "gpio_in": DigitalInput,
+    "pwm": PWMOutput,
+    "dht11": HumiditySensor,
+    "mqtt": MQTTClient,
+}
+DEVICE_KINDS = tuple(DEVICE_PROTOCOLS)
+
+# (backend name, kind) -> factory
+registry = {}
+backend_name = None
+
+def register_backend(name, kind):
+    if kind not in DEVICE_KINDS:
+        raise ValueError(f"Unknown device kind: {kind}")
+    def decorator(factory):
+        registry[(name, kind)] = factory
+        return factory
+    return decorator
+
+def set_backend(name):
+    global backend_name
+    backend_name = name
+
+def get_backend():
+    if backend_name is None:
+        set_backend(os.environ.get(BACKEND_ENV_VAR, BACKEND_DEFAULT))
+    return backend_name
+
+# The backend module is imported on first use, and it imports the hardware
+# library for a device only when that device is created
+def create_device(kind, *args, **kwargs):
+    name = get_backend()
+    if (name, kind) not in registry:
+        importlib.import_module(f"backends.{name}")
+    factory = registry.get((name, kind))
+    if factory is None:
+        raise ValueError(f"Backend {name} has no {kind} device")
+    return factory(*args, **kwargs)
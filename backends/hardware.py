@@ -0,0 +1,85 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# hardware.py
+# Raspberry Pi backend, libraries are imported when a device is created
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import fcntl
+
+from .base import register_backend
+
+BACKEND_NAME = "hardware"
+
+# ioctl request of i2c-dev that sets the slave address for read()/write()
+I2C_SLAVE = 0x0703
+
+# smbus.SMBus plus the plain read smbus does not have: every smbus block read
+# writes a command byte first, which restarts a BH1750 conversion
+class HardwareI2C:
+    def __init__(self, bus_id):
+        import smbus
+        self.smbus = smbus.SMBus(bus_id)
+        self.device = open(f"/dev/i2c-{bus_id}", "rb", buffering=0)
+        self.address = None
+
+    def write_byte(self, address, value):
+        self.smbus.write_byte(address, value)
+
+    def read_byte(self, address):
+        return self.smbus.read_byte(address)
+
+    def read_i2c_block_data(self, address, command, length):
+        return self.smbus.read_i2c_block_data(address, command, length)
+
+    def read_bytes(self, address, length):
+        if address != self.address:
+            fcntl.ioctl(self.device, I2C_SLAVE, address)
+            self.address = address
+        data = self.device.read(length)
+        if len(data) < length:
+            raise OSError(121, "Remote I/O error")
+        return list(data)
+
+    def close(self):
+        self.smbus.close()
+        self.device.close()
+
+@register_backend(BACKEND_NAME, "i2c")
+def open_i2c(bus_id):
+    return HardwareI2C(bus_id)
+
+@register_backend(BACKEND_NAME, "spi")
+def open_spi(bus_id, chip_id):
+    import spidev
+    spi_dev = spidev.SpiDev()
+    spi_dev.open(bus_id, chip_id)
+    return spi_dev
+
+@register_backend(BACKEND_NAME, "gpio_out")
+def open_gpio_out(pin):
+    from gpiozero import LED
+    return LED(pin)
+
+@register_backend(BACKEND_NAME, "gpio_in")
+def open_gpio_in(pin, pull_up=False):
+    from gpiozero import DigitalInputDevice
+    return DigitalInputDevice(pin, pull_up=pull_up)
+
+@register_backend(BACKEND_NAME, "pwm")
+def open_pwm(channel, hz, chip):
+    from rpi_hardware_pwm import HardwarePWM
+    return HardwarePWM(pwm_channel=channel, hz=hz, chip=chip)
+
+@register_backend(BACKEND_NAME, "dht11")
+def open_dht11(pin):
+    # board is slow to import and probes the platform, only load it here
+    import board
+    import adafruit_dht
+    return adafruit_dht.DHT11(getattr(board, f"D{pin}"))
+
+@register_backend(BACKEND_NAME, "mqtt")
+def open_mqtt():
+    import paho.mqtt.client as paho
+    return paho.Client(client_id="", userdata=None, protocol=paho.MQTTv5)
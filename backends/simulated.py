@@ -0,0 +1,329 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# simulated.py
+# Simulated devices with realistic timing, to run the node without a Pi
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import itertools
+import math
+import random
+import threading
+import time
+from collections import deque
+
+from .base import register_backend
+
+BACKEND_NAME = "simulated"
+
+SIM_I2C_CLOCK_HZ = 100000
+SIM_BH1750_ADDRESSES = (0x23, 0x5C)
+SIM_DHT11_READ_TIME = 0.023         # 18 ms start signal plus 40 bits
+SIM_DHT11_MIN_INTERVAL = 1.0
+SIM_DHT11_ERROR_RATE = 0.1
+SIM_MQTT_CONNECT_TIME = 0.2
+SIM_MQTT_PUBLISH_LATENCY = 0.05
+# Delay between connection attempts of the network loop, as paho's minimum
+SIM_MQTT_RECONNECT_DELAY = 1.0
+
+# Slow day/night style swing with some noise, in lx
+def simulated_light_level(timestamp=None):
+    if timestamp is None:
+        timestamp = time.monotonic()
+    level = 150 + 120 * math.sin(2 * math.pi * timestamp / 120) + random.gauss(0, 2)
+    return max(level, 0.0)
+
+def i2c_transfer_time(n_bytes):
+    # Address byte plus data, 9 clocks per byte with the ACK
+    return (n_bytes + 1) * 9 / SIM_I2C_CLOCK_HZ
+
+class SimulatedBH1750:
+    def __init__(self):
+        self.mode = None
+        self.mtreg = 69
+        self.mtreg_pending = 69
+        self.start_time = None
+        self.data = [0, 0]
+
+    def measurement_time(self):
+        base_time = 0.016 if self.mode in (0x13, 0x23) else 0.120
+        return base_time * self.mtreg / 69
+
+    def update_result(self):
+        if self.mode is None or self.start_time is None:
+            return
+        now = time.monotonic()
+        if now - self.start_time < self.measurement_time():
+            return
+        raw = simulated_light_level(now) * 1.2 * self.mtreg / 69
+        if self.mode in (0x11, 0x21):
+            raw *= 2
+        raw = min(int(raw), 0xFFFF)
+        self.data = [raw >> 8, raw & 0xFF]
+        if self.mode & 0x20:
+            # One-time modes power down after the measurement
+            self.mode = None
+            self.start_time = None
+        else:
+            self.start_time = now
+
+    def command(self, value):
+        if value == 0x00:
+            self.mode = None
+        elif value == 0x07:
+            self.data = [0, 0]
+        elif value & 0xF8 == 0x40:
+            self.mtreg_pending = (self.mtreg_pending & 0x1F) | ((value & 0x07) << 5)
+        elif value & 0xE0 == 0x60:
+            self.mtreg_pending = (self.mtreg_pending & 0xE0) | (value & 0x1F)
+        elif value in (0x10, 0x11, 0x13, 0x20, 0x21, 0x23):
+            self.mtreg = self.mtreg_pending
+            self.mode = value
+            self.start_time = time.monotonic()
+
+@register_backend(BACKEND_NAME, "i2c")
+class SimulatedI2C:
+    def __init__(self, bus_id):
+        self.bus_id = bus_id
+        self.devices = {address: SimulatedBH1750() for address in SIM_BH1750_ADDRESSES}
+        self.lock = threading.Lock()
+
+    def device(self, address):
+        device = self.devices.get(address)
+        if device is None:
+            raise OSError(121, "Remote I/O error")
+        return device
+
+    def write_byte(self, address, value):
+        with self.lock:
+            time.sleep(i2c_transfer_time(1))
+            self.device(address).command(value)
+
+    def read_byte(self, address):
+        with self.lock:
+            time.sleep(i2c_transfer_time(1))
+            device = self.device(address)
+            device.update_result()
+            return device.data[0]
+
+    # Command byte is written first, the data is read after a repeated start
+    def read_i2c_block_data(self, address, command, length):
+        with self.lock:
+            time.sleep(i2c_transfer_time(1 + length))
+            device = self.device(address)
+            device.update_result()
+            data = list(device.data[:length])
+            device.command(command)
+            return data
+
+    def read_bytes(self, address, length):
+        with self.lock:
+            time.sleep(i2c_transfer_time(length))
+            device = self.device(address)
+            device.update_result()
+            return list(device.data[:length])
+
+    def close(self):
+        pass
+
+@register_backend(BACKEND_NAME, "spi")
+class SimulatedSPI:
+    def __init__(self, bus_id, chip_id):
+        self.bus_id = bus_id
+        self.chip_id = chip_id
+        self.max_speed_hz = 500000
+        self.mode = 0
+        self.bytes_transferred = 0
+
+    def transfer_time(self, n_bytes):
+        return n_bytes * 8 / self.max_speed_hz
+
+    def xfer2(self, data):
+        n_bytes = len(data)
+        time.sleep(self.transfer_time(n_bytes))
+        self.bytes_transferred += n_bytes
+        return [0] * n_bytes
+
+    def writebytes2(self, data):
+        n_bytes = memoryview(data).nbytes if not isinstance(data, list) else len(data)
+        time.sleep(self.transfer_time(n_bytes))
+        self.bytes_transferred += n_bytes
+
+    def close(self):
+        pass
+
+@register_backend(BACKEND_NAME, "gpio_out")
+class SimulatedDigitalOutput:
+    def __init__(self, pin):
+        self.pin = pin
+        self.value = 0
+
+    def on(self):
+        self.value = 1
+
+    def off(self):
+        self.value = 0
+
+@register_backend(BACKEND_NAME, "gpio_in")
+class SimulatedDigitalInput:
+    def __init__(self, pin, pull_up=False):
+        self.pin = pin
+        self.pull_up = pull_up
+        self.is_active = False
+        self.when_activated = None
+        self.when_deactivated = None
+
+    # Drive the input from a test or a simulation script
+    def set_active(self, state):
+        if state == self.is_active:
+            return
+        self.is_active = state
+        callback = self.when_activated if state else self.when_deactivated
+        if callback is not None:
+            callback()
+
+@register_backend(BACKEND_NAME, "pwm")
+class SimulatedPWM:
+    def __init__(self, channel, hz, chip):
+        self.channel = channel
+        self.hz = hz
+        self.chip = chip
+        self.duty_cycle = None
+
+    def start(self, duty_cycle):
+        self.duty_cycle = duty_cycle
+
+    def change_duty_cycle(self, duty_cycle):
+        self.duty_cycle = duty_cycle
+
+    def stop(self):
+        self.duty_cycle = None
+
+@register_backend(BACKEND_NAME, "dht11")
+class SimulatedDHT11:
+    def __init__(self, pin):
+        self.pin = pin
+        self.temperature = None
+        self.humidity = None
+        self.base_temperature = 24.0
+        self.base_humidity = 55.0
+        self.last_read = 0
+
+    # Like adafruit_dht, reads closer together than the minimum interval are skipped
+    def measure(self):
+        now = time.monotonic()
+        if now - self.last_read < SIM_DHT11_MIN_INTERVAL:
+            return
+        self.last_read = now
+        time.sleep(SIM_DHT11_READ_TIME)
+        if random.random() < SIM_DHT11_ERROR_RATE:
+            raise RuntimeError("Checksum did not validate. Try again.")
+        self.base_temperature = min(max(self.base_temperature + random.gauss(0, 0.2), 0), 50)
+        self.base_humidity = min(max(self.base_humidity + random.gauss(0, 0.5), 20), 90)
+        # DHT11 has 1 degree and 1 % resolution
+        self.temperature = round(self.base_temperature)
+        self.humidity = round(self.base_humidity)
+
+class SimulatedPublishInfo:
+    def __init__(self, mid, rc=0):
+        self.mid = mid
+        self.rc = rc
+        self.published = threading.Event()
+
+    def is_published(self):
+        return self.published.is_set()
+
+    def wait_for_publish(self, timeout=None):
+        self.published.wait(timeout)
+
+@register_backend(BACKEND_NAME, "mqtt")
+class SimulatedMQTTClient:
+    def __init__(self):
+        self.on_connect = None
+        self.on_disconnect = None
+        self.on_message = None
+        self.on_publish = None
+        self.on_subscribe = None
+        self.is_connected_flag = False
+        # Set False to simulate an uplink outage, connect attempts then fail
+        self.is_reachable = True
+        self.host = None
+        self.loop_thread = None
+        self.mid_counter = itertools.count(1)
+        # Last published (topic, payload, qos), for inspection
+        self.messages = deque(maxlen=1000)
+
+    def tls_set(self, **kwargs):
+        pass
+
+    def username_pw_set(self, user, password):
+        pass
+
+    def connect(self, host, port=1883, keepalive=60):
+        time.sleep(SIM_MQTT_CONNECT_TIME)
+        if not self.is_reachable:
+            raise OSError(101, "Network is unreachable")
+        self.is_connected_flag = True
+        return 0
+
+    # The network loop connects, and keeps retrying until it succeeds
+    def connect_async(self, host, port=1883, keepalive=60):
+        self.host = host
+
+    def reconnect(self):
+        return self.connect(self.host)
+
+    def disconnect(self):
+        self.is_connected_flag = False
+        if self.on_disconnect is not None:
+            self.on_disconnect(self, None, 0)
+        return 0
+
+    def is_connected(self):
+        return self.is_connected_flag
+
+    def loop_start(self):
+        if self.loop_thread is not None:
+            return
+        self.loop_thread = threading.Thread(target=self.loop, daemon=True)
+        self.loop_thread.start()
+
+    def loop(self):
+        while self.loop_thread is not None and not self.is_connected_flag:
+            try:
+                self.reconnect()
+            except OSError:
+                time.sleep(SIM_MQTT_RECONNECT_DELAY)
+                continue
+            if self.on_connect is not None:
+                self.on_connect(self, None, {}, 0, None)
+
+    def loop_stop(self):
+        self.loop_thread = None
+
+    def subscribe(self, topic, qos=0):
+        if not self.is_connected_flag:
+            # MQTT_ERR_NO_CONN
+            return 4, None
+        mid = next(self.mid_counter)
+        if self.on_subscribe is not None:
+            self.on_subscribe(self, None, mid, (qos,), None)
+        return 0, mid
+
+    def publish(self, topic, payload=None, qos=0, retain=False):
+        info = SimulatedPublishInfo(next(self.mid_counter))
+        if not self.is_connected_flag:
+            # MQTT_ERR_NO_CONN
+            info.rc = 4
+            return info
+        self.messages.append((topic, payload, qos))
+        timer = threading.Timer(SIM_MQTT_PUBLISH_LATENCY, self.complete_publish, (info,))
+        timer.daemon = True
+        timer.start()
+        return info
+
+    def complete_publish(self, info):
+        info.published.set()
+        if self.on_publish is not None:
+            self.on_publish(self, None, info.mid)
@@ -0,0 +1,101 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# i2c_bus.py
+# One shared handle per I2C bus, serialized and batched device access
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import threading
+import time
+from contextlib import contextmanager
+
+from backends.base import create_device
+
+# Addresses probed by scan(), as i2cdetect does by default
+I2C_SCAN_FIRST = 0x03
+I2C_SCAN_LAST = 0x77
+
+# bus_id -> I2CBus, so every driver on a bus shares one handle
+i2c_buses = {}
+i2c_buses_lock = threading.Lock()
+
+def get_bus(bus_id=1):
+    with i2c_buses_lock:
+        bus = i2c_buses.get(bus_id)
+        if bus is None:
+            bus = i2c_buses[bus_id] = I2CBus(bus_id)
+        return bus
+
+class I2CBus:
+    def __init__(self, bus_id=1):
+        self.bus_id = bus_id
+        self.bus = create_device("i2c", bus_id)
+        # Reentrant so a driver can hold the bus over several transfers
+        self.lock = threading.RLock()
+        self.transfers = 0
+        self.errors = 0
+
+    @contextmanager
+    def transaction(self):
+        with self.lock:
+            yield self
+
+    def run(self, func, *args):
+        with self.lock:
+            self.transfers += 1
+            try:
+                return func(*args)
+            except OSError:
+                self.errors += 1
+                raise
+
+    # Same methods as smbus.SMBus so drivers do not need to change
+    def write_byte(self, address, value):
+        return self.run(self.bus.write_byte, address, value)
+
+    def read_byte(self, address):
+        return self.run(self.bus.read_byte, address)
+
+    def read_i2c_block_data(self, address, command, length):
+        return self.run(self.bus.read_i2c_block_data, address, command, length)
+
+    # Plain read with no command byte in front
+    def read_bytes(self, address, length):
+        return self.run(self.bus.read_bytes, address, length)
+
+    # Return the addresses that acknowledge a read
+    def scan(self, first=I2C_SCAN_FIRST, last=I2C_SCAN_LAST):
+        found = []
+        with self.lock:
+            for address in range(first, last + 1):
+                try:
+                    self.bus.read_byte(address)
+                except OSError:
+                    continue
+                found.append(address)
+        return found
+
+    # Start a conversion on every device, wait once for the slowest, then
+    # read them all. Devices provide trigger(), conversion_time() and
+    # read_result(). The bus is free for others during the wait
+    def read_all(self, devices):
+        with self.lock:
+            for device in devices:
+                device.trigger()
+        trigger_time = time.monotonic()
+        wait = max((device.conversion_time() for device in devices), default=0)
+        delay = trigger_time + wait - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        with self.lock:
+            return [device.read_result() for device in devices]
+
+    def close(self):
+        self.bus.close()
+
+
+if __name__ == "__main__":
+    bus = get_bus(1)
+    addresses = bus.scan()
+    print(f"I2C bus {bus.bus_id}: " + (", ".join(f"0x{address:02X}" for address in addresses) or "no devices"))
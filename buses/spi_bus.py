@@ -0,0 +1,173 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# spi_bus.py
+# Share one SPI bus between devices (ili9341 on CE0, xpt2046 on CE1)
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+from backends.base import create_device
+
+# Lower value wins when several devices wait for the bus
+SPI_PRIORITY_HIGH = 0
+SPI_PRIORITY_NORMAL = 1
+
+# Long writes are split into chunks and the bus is released between them,
+# so a high priority device waits for at most one chunk
+SPI_BUS_CHUNK_SIZE = 4096
+
+class PriorityLock:
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.waiting = []
+        self.counter = itertools.count()
+        self.is_locked = False
+        self.owner = None
+        self.depth = 0
+
+    def acquire(self, priority):
+        with self.condition:
+            me = threading.get_ident()
+            if self.is_locked and self.owner == me:
+                self.depth += 1
+                return
+            ticket = (priority, next(self.counter))
+            heapq.heappush(self.waiting, ticket)
+            while self.is_locked or self.waiting[0] != ticket:
+                self.condition.wait()
+            heapq.heappop(self.waiting)
+            self.is_locked = True
+            self.owner = me
+            self.depth = 1
+
+    def release(self):
+        with self.condition:
+            self.depth -= 1
+            if self.depth > 0:
+                return
+            self.is_locked = False
+            self.owner = None
+            self.condition.notify_all()
+
+class SpiDevice:
+    def __init__(self, spi_bus, chip_id, max_speed_hz, mode, priority):
+        self.spi_bus = spi_bus
+        self.chip_id = chip_id
+        self.priority = priority
+        self.spi_dev = create_device("spi", spi_bus.bus_id, chip_id)
+        # Settings requested by the driver and the ones applied to the handle
+        self.speed_hz = max_speed_hz
+        self.spi_mode = mode
+        self.applied_speed_hz = None
+        self.applied_mode = None
+
+        self.bytes_transferred = 0
+        self.transfers = 0
+        self.busy_time = 0.0
+
+    # Same attributes as spidev.SpiDev so drivers do not need to change
+    @property
+    def max_speed_hz(self):
+        return self.speed_hz
+
+    @max_speed_hz.setter
+    def max_speed_hz(self, speed_hz):
+        self.speed_hz = speed_hz
+
+    @property
+    def mode(self):
+        return self.spi_mode
+
+    @mode.setter
+    def mode(self, mode):
+        self.spi_mode = mode
+
+    def apply_settings(self):
+        if self.applied_mode != self.spi_mode:
+            self.spi_dev.mode = self.spi_mode
+            self.applied_mode = self.spi_mode
+        if self.applied_speed_hz != self.speed_hz:
+            self.spi_dev.max_speed_hz = self.speed_hz
+            self.applied_speed_hz = self.speed_hz
+
+    # Hold the bus across several transfers that must not be interleaved
+    @contextmanager
+    def transaction(self):
+        self.spi_bus.lock.acquire(self.priority)
+        try:
+            yield self
+        finally:
+            self.spi_bus.lock.release()
+
+    def run(self, func, data, n_bytes):
+        with self.transaction():
+            self.apply_settings()
+            start = time.monotonic()
+            try:
+                return func(data)
+            finally:
+                elapsed = time.monotonic() - start
+                self.busy_time += elapsed
+                self.spi_bus.busy_time += elapsed
+                self.bytes_transferred += n_bytes
+                self.transfers += 1
+
+    def xfer2(self, data):
+        return self.run(self.spi_dev.xfer2, data, len(data))
+
+    def writebytes2(self, data):
+        view = memoryview(data).cast('B')
+        for i in range(0, len(view), SPI_BUS_CHUNK_SIZE):
+            chunk = view[i : i + SPI_BUS_CHUNK_SIZE]
+            self.run(self.spi_dev.writebytes2, chunk, len(chunk))
+
+    def close(self):
+        self.spi_dev.close()
+
+class SPIBus:
+    def __init__(self, bus_id=0):
+        self.bus_id = bus_id
+        self.lock = PriorityLock()
+        self.devices = {}
+        self.start_time = time.monotonic()
+        self.busy_time = 0.0
+
+    def open_device(self, chip_id, max_speed_hz, mode=0, priority=SPI_PRIORITY_NORMAL):
+        device = self.devices.get(chip_id)
+        if device is None:
+            device = SpiDevice(self, chip_id, max_speed_hz, mode, priority)
+            self.devices[chip_id] = device
+        return device
+
+    # Fraction of wall time the bus spent transferring since start or reset_stats()
+    def utilization(self):
+        elapsed = time.monotonic() - self.start_time
+        if elapsed <= 0:
+            return 0.0
+        return self.busy_time / elapsed
+
+    def reset_stats(self):
+        self.start_time = time.monotonic()
+        self.busy_time = 0.0
+        for device in self.devices.values():
+            device.bytes_transferred = 0
+            device.transfers = 0
+            device.busy_time = 0.0
+
+    def report(self):
+        elapsed = time.monotonic() - self.start_time
+        print(f"SPI bus {self.bus_id}: {self.utilization() * 100:.1f}% busy over {elapsed:.1f} s")
+        for chip_id, device in sorted(self.devices.items()):
+            print(f"  CE{chip_id}: {device.transfers} transfers, {device.bytes_transferred} bytes, "
+                  f"{device.busy_time * 1000:.1f} ms at {device.speed_hz / 1e6:.2f} MHz")
+
+    def close(self):
+        for device in self.devices.values():
+            device.close()
+        self.devices = {}
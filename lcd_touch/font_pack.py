@@ -0,0 +1,45 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# font_pack.py
+# Convert the font tables in font_tables.py to packed font files
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import os
+
+from .font import FONT_DIR, FONT_HEADER, FONT_MAGIC, FONT_NAMES
+
+FONT_TABLE_FIRST_CHAR = 32
+
+# Table rows are 16-bit ints with the leftmost pixel in bit 15
+def pack_font(table):
+    width = table['width']
+    height = table['height']
+    glyph_count = len(table['data']) // height
+    glyph_bytes = (width * height + 7) // 8
+
+    glyphs = []
+    for glyph_index in range(glyph_count):
+        bits = 0
+        for row in table['data'][glyph_index * height : (glyph_index + 1) * height]:
+            bits = (bits << width) | ((row >> (16 - width)) & ((1 << width) - 1))
+        bits <<= glyph_bytes * 8 - width * height
+        glyphs.append(bits.to_bytes(glyph_bytes, 'big'))
+
+    header = FONT_HEADER.pack(FONT_MAGIC, width, height, FONT_TABLE_FIRST_CHAR, glyph_bytes, glyph_count)
+    return header + b"".join(glyphs)
+
+def write_font_file(path, table):
+    with open(path, "wb") as f:
+        f.write(pack_font(table))
+
+
+if __name__ == "__main__":
+    # Run as: python -m lcd_touch.font_pack
+    from . import font_tables
+    os.makedirs(FONT_DIR, exist_ok=True)
+    for name in FONT_NAMES:
+        path = os.path.join(FONT_DIR, name + ".bin")
+        write_font_file(path, getattr(font_tables, name))
+        print(f"Wrote {path} ({os.path.getsize(path)} bytes)")
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# framebuffer.py
+# Off-screen RGB565 surface with dirty rectangle tracking
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+
+# Rows are compared in blocks of this many pixels when looking for changes
+FRAMEBUFFER_BLOCK_PIXELS = 8
+# Dirty blocks separated by up to this many clean blocks are sent together,
+# re-sending a few clean pixels is cheaper than opening a new address window
+FRAMEBUFFER_MERGE_GAP = 2
+
+class FrameBuffer:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stride = width * 2
+        # buffer holds what we want on the panel, shadow holds what was last sent
+        self.buffer = bytearray(self.stride * height)
+        self.shadow = bytearray(self.stride * height)
+        # Content of the panel is unknown until the first full flush
+        self.synced = False
+
+    def clip(self, x, y, w, h):
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.width, x + w)
+        y1 = min(self.height, y + h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1 - x0, y1 - y0
+
+    def fill_rectangle(self, x, y, w, h, color):
+        rect = self.clip(x, y, w, h)
+        if rect is None:
+            return
+        x, y, w, h = rect
+        row_data = bytes(((color >> 8) & 0xFF, color & 0xFF)) * w
+        for row in range(y, y + h):
+            start = row * self.stride + x * 2
+            self.buffer[start : start + w * 2] = row_data
+
+    def blit(self, x, y, w, h, data):
+        rect = self.clip(x, y, w, h)
+        if rect is None:
+            return
+        cx, cy, cw, ch = rect
+        src = memoryview(data).cast('B')
+        src_stride = w * 2
+        src_offset = (cy - y) * src_stride + (cx - x) * 2
+        for row in range(ch):
+            start = (cy + row) * self.stride + cx * 2
+            src_start = src_offset + row * src_stride
+            self.buffer[start : start + cw * 2] = src[src_start : src_start + cw * 2]
+
+    def get_rectangle(self, x, y, w, h):
+        if x == 0 and w == self.width:
+            return memoryview(self.buffer)[y * self.stride : (y + h) * self.stride]
+        rows = []
+        for row in range(y, y + h):
+            start = row * self.stride + x * 2
+            rows.append(self.buffer[start : start + w * 2])
+        return b"".join(rows)
+
+    def row_spans(self, row):
+        block_bytes = FRAMEBUFFER_BLOCK_PIXELS * 2
+        base = row * self.stride
+        spans = []
+        span_start = None
+        span_end = None
+        for block_start in range(0, self.stride, block_bytes):
+            start = base + block_start
+            end = min(start + block_bytes, base + self.stride)
+            if self.buffer[start:end] == self.shadow[start:end]:
+                continue
+            x0 = block_start // 2
+            x1 = min(self.width, x0 + FRAMEBUFFER_BLOCK_PIXELS)
+            if span_end is not None and (x0 - span_end) <= FRAMEBUFFER_MERGE_GAP * FRAMEBUFFER_BLOCK_PIXELS:
+                span_end = x1
+            else:
+                if span_start is not None:
+                    spans.append((span_start, span_end))
+                span_start = x0
+                span_end = x1
+        if span_start is not None:
+            spans.append((span_start, span_end))
+        return spans
+
+    # Return list of (x, y, w, h) covering every pixel that differs from the shadow
+    def dirty_rectangles(self):
+        if not self.synced:
+            return [(0, 0, self.width, self.height)]
+
+        closed_rects = []
+        open_rects = []     # [x0, x1, y0, y1], x1/y1 exclusive
+        for row in range(self.height):
+            start = row * self.stride
+            end = start + self.stride
+            if self.buffer[start:end] == self.shadow[start:end]:
+                spans = []
+            else:
+                spans = self.row_spans(row)
+
+            next_open_rects = []
+            for x0, x1 in spans:
+                for rect in open_rects:
+                    if rect[0] < x1 and x0 < rect[1]:
+                        rect[0] = min(rect[0], x0)
+                        rect[1] = max(rect[1], x1)
+                        rect[3] = row + 1
+                        open_rects.remove(rect)
+                        next_open_rects.append(rect)
+                        break
+                else:
+                    next_open_rects.append([x0, x1, row, row + 1])
+            closed_rects.extend(open_rects)
+            open_rects = next_open_rects
+        closed_rects.extend(open_rects)
+
+        return [(x0, y0, x1 - x0, y1 - y0) for x0, x1, y0, y1 in closed_rects]
+
+    def mark_synced(self):
+        self.shadow[:] = self.buffer
+        self.synced = True
+
+    def invalidate(self):
+        self.synced = False
@@ -0,0 +1,56 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# glyph_cache.py
+# LRU cache of rendered RGB565 glyphs for ili9341
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from collections import OrderedDict
+
+GLYPH_CACHE_SIZE = 256
+GLYPH_FALLBACK_CHAR = '?'
+
+def render_glyph(font, color, bgcolor, char_code):
+    if not font.has_char(char_code):
+        char_code = GLYPH_FALLBACK_CHAR
+    color_on_bytes = bytes(((color >> 8) & 0xFF, color & 0xFF))
+    color_off_bytes = bytes(((bgcolor >> 8) & 0xFF, bgcolor & 0xFF))
+
+    return b"".join(color_on_bytes if bit == '1' else color_off_bytes
+                    for bit in font.glyph_bits(char_code))
+
+class GlyphCache:
+    def __init__(self, max_size=GLYPH_CACHE_SIZE):
+        self.max_size = max_size
+        self.glyphs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_glyph(self, font, color, bgcolor, char_code):
+        # Loaded fonts are kept for the program lifetime, so their id is stable
+        key = (id(font), color, bgcolor, char_code)
+        glyph = self.glyphs.get(key)
+        if glyph is not None:
+            self.glyphs.move_to_end(key)
+            self.hits += 1
+            return glyph
+
+        self.misses += 1
+        glyph = render_glyph(font, color, bgcolor, char_code)
+        self.glyphs[key] = glyph
+        if len(self.glyphs) > self.max_size:
+            self.glyphs.popitem(last=False)
+        return glyph
+
+    # Compose a single line of text into one (len(text) * width) x height pixel block
+    def render_run(self, text, font, color, bgcolor):
+        glyphs = [self.get_glyph(font, color, bgcolor, char_code) for char_code in text]
+        if len(glyphs) == 1:
+            return glyphs[0]
+        row_bytes = font['width'] * 2
+        return b"".join(glyph[row * row_bytes : (row + 1) * row_bytes]
+                        for row in range(font['height']) for glyph in glyphs)
+
+    def clear(self):
+        self.glyphs.clear()
@@ -7,9 +7,13 @@
 # Date   : 15 June 2025
 #---------------------------------------------------------------------
 import time
-from gpiozero import LED
-import spidev
+import mmap
+from contextlib import contextmanager
+from backends.base import create_device
 from . import font
+from .framebuffer import FrameBuffer
+from .glyph_cache import GlyphCache
+from . import image
 
 
 # Resolution of LCD
@@ -35,29 +39,93 @@ ILI9341_MAGENTA = 0xF81F
 ILI9341_YELLOW = 0xFFE0
 ILI9341_WHITE = 0xFFFF
 
-class ILI9341:
-    def __init__(self, dc_pin, reset_pin, chip_id, resolution_x, resolution_y, display_rotation):
-        self.dc_pin = LED(dc_pin)
-        self.reset_pin = LED(reset_pin)
+# Default SPI clock, the datasheet serial write cycle is 100 ns minimum.
+# Run lcd_touch/spi_tune.py to find the fastest reliable one for the board
+ILI9341_SPI_SPEED_HZ = 10000000
+
+# Number of gate lines covered by the vertical scrolling definition
+ILI9341_SCROLL_LINES = 320
+
+# Reset timing from the datasheet: RESX low pulse >= 10 us, 5 ms before the
+# first command and 120 ms before Sleep Out
+ILI9341_RESET_PULSE_MS = 0.02
+ILI9341_RESET_WAIT_MS = 5
+ILI9341_RESET_SLEEP_OUT_MS = 120
+
+# (command, data, delay in ms after it). MADCTL (0x36) data comes from display_rotation
+ILI9341_INIT_SEQUENCE = (
+    (0x01, b"", 5),                                         # Software reset
+    (0xCB, bytes((0x39, 0x2C, 0x00, 0x34, 0x02)), 0),       # Power control A
+    (0xCF, bytes((0x00, 0xC1, 0x30)), 0),                   # Power control B
+    (0xE8, bytes((0x85, 0x00, 0x78)), 0),                   # Driver timing control A
+    (0xEA, bytes((0x00, 0x00)), 0),                         # Driver timing control B
+    (0xED, bytes((0x64, 0x03, 0x12, 0x81)), 0),             # Power on sequence control
+    (0xF7, bytes((0x20,)), 0),                              # Pump ratio control
+    (0xC0, bytes((0x23,)), 0),                              # Power control 1
+    (0xC1, bytes((0x10,)), 0),                              # Power control 2
+    (0xC5, bytes((0x3E, 0x28)), 0),                         # VCOM control 1
+    (0xC7, bytes((0x86,)), 0),                              # VCOM control 2
+    (0x36, None, 0),                                        # Memory access control
+    (0x3A, bytes((0x55,)), 0),                              # Pixel format 16 bit
+    (0xB1, bytes((0x00, 0x18)), 0),                         # Frame rate control
+    (0xB6, bytes((0x08, 0x82, 0x27)), 0),                   # Display function control
+    (0xF2, bytes((0x00,)), 0),                              # 3Gamma function disable
+    (0x26, bytes((0x01,)), 0),                              # Gamma curve
+    (0xE0, bytes((0x0F, 0x31, 0x2B, 0x0C, 0x0E, 0x08, 0x4E, 0xF1,
+                  0x37, 0x07, 0x10, 0x03, 0x0E, 0x09, 0x00)), 0),   # Positive gamma
+    (0xE1, bytes((0x00, 0x0E, 0x14, 0x03, 0x11, 0x07, 0x31, 0xC1,
+                  0x48, 0x08, 0x0F, 0x0C, 0x31, 0x36, 0x0F)), 0),   # Negative gamma
+    (0x11, b"", 5),                                         # Sleep out
+    (0x29, b"", 0),                                         # Display on
+)
+
+# Solid fills are streamed from a block of this many repeated pixels
+ILI9341_FILL_BLOCK_PIXELS = 2048
 
-        self.spi_dev = spidev.SpiDev()
-        self.spi_dev.open(0, chip_id)
-        self.spi_dev.max_speed_hz = 500000
+class ILI9341:
+    def __init__(self, dc_pin, reset_pin, chip_id, resolution_x, resolution_y, display_rotation, use_framebuffer=False,
+                 spi_speed_hz=ILI9341_SPI_SPEED_HZ, spi_bus=None):
+        self.dc_pin = create_device("gpio_out", dc_pin)
+        self.reset_pin = create_device("gpio_out", reset_pin)
+
+        # With a shared buses.spi_bus.SPIBus the display gives way to touch reads
+        if spi_bus is not None:
+            self.spi_dev = spi_bus.open_device(chip_id, spi_speed_hz)
+        else:
+            self.spi_dev = create_device("spi", 0, chip_id)
+            self.spi_dev.max_speed_hz = spi_speed_hz
 
         self.resolution_x = resolution_x
         self.resolution_y = resolution_y
         self.display_rotation = display_rotation
 
+        # In framebuffer mode drawing only touches memory, call flush() to update the panel
+        self.framebuffer = None
+        if use_framebuffer:
+            self.framebuffer = FrameBuffer(resolution_x, resolution_y)
+
+        self.glyph_cache = GlyphCache()
+        self.init_time = None
+
+        # Cached D/C level and address window, so unchanged state is not re-sent
+        self.dc_state = None
+        self.window_columns = None
+        self.window_rows = None
+        # Commands and data recorded while a batch is open, as [is_data, bytearray]
+        self.batch_depth = 0
+        self.batch_segments = []
+
     def delay_ms(self, ms):
         time.sleep(ms/1000)
 
+    @staticmethod
     def color_RGB(r, g, b):
-        r = max(0, min(255, r))
-        g = max(0, min(255, g))
-        b = max(0, min(255, b))
-        return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+        return image.color_rgb(r, g, b)
     
     def ctrl_dc(self, state):
+        if state == self.dc_state:
+            return
+        self.dc_state = state
         if state == True:
             self.dc_pin.on()
         else:
@@ -65,8 +133,17 @@ class ILI9341:
 
     def reset_lcd(self):
         self.reset_pin.off()
-        self.delay_ms(5)
+        self.delay_ms(ILI9341_RESET_PULSE_MS)
         self.reset_pin.on()
+        self.delay_ms(ILI9341_RESET_WAIT_MS)
+        self.invalidate_window()
+
+    def invalidate_window(self):
+        self.window_columns = None
+        self.window_rows = None
+
+    def set_spi_speed(self, speed_hz):
+        self.spi_dev.max_speed_hz = speed_hz
 
     def spi_dev_transmit(self, data_list):
         CHUNK_SIZE = 4096
@@ -80,128 +157,192 @@ class ILI9341:
                 print(f"SPI dev transmit error: {e}")
                 return []
         return receive_data
+
+    # Write-only path, accept list, bytes, bytearray, memoryview or any buffer (e.g. NumPy array)
+    def spi_dev_write(self, data):
+        if isinstance(data, (list, tuple)):
+            data = bytes(data)
+        view = memoryview(data)
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        try:
+            self.spi_dev.writebytes2(view.cast('B'))
+        except Exception as e:
+            print(f"SPI dev write error: {e}")
     
+    # Record commands and data instead of sending them until the outermost
+    # end_batch(). Consecutive writes of the same kind are merged so they go
+    # out with one D/C change and one SPI call
+    def begin_batch(self):
+        self.batch_depth += 1
+
+    def end_batch(self):
+        self.batch_depth -= 1
+        if self.batch_depth == 0:
+            self.send_batch_segments()
+
+    def send_batch_segments(self):
+        segments = self.batch_segments
+        self.batch_segments = []
+        for is_data, data in segments:
+            self.ctrl_dc(is_data)
+            self.spi_dev_write(data)
+
+    @contextmanager
+    def batch(self):
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    # Draw straight to the panel in framebuffer mode. The caller brings the
+    # framebuffer in line with the panel afterwards
+    @contextmanager
+    def direct(self):
+        framebuffer = self.framebuffer
+        self.framebuffer = None
+        try:
+            yield self
+        finally:
+            self.framebuffer = framebuffer
+
+    def send(self, is_data, data):
+        if isinstance(data, (list, tuple)):
+            data = bytes(data)
+        if self.batch_depth > 0 and memoryview(data).nbytes >= ILI9341_FILL_BLOCK_PIXELS * 2:
+            # Large buffers are sent as they are rather than copied into the batch
+            self.send_batch_segments()
+        elif self.batch_depth > 0:
+            if self.batch_segments and self.batch_segments[-1][0] == is_data:
+                self.batch_segments[-1][1] += data
+            else:
+                self.batch_segments.append([is_data, bytearray(data)])
+            return
+        self.ctrl_dc(is_data)
+        self.spi_dev_write(data)
+
     def write_command(self, cmd):
+        self.send(False, bytes((cmd,)))
+
+    # Send a command and clock out n_bytes of response in the same transfer.
+    # Needs the SDO (MISO) pin of the panel to be wired
+    def read_command(self, cmd, n_bytes):
+        if self.batch_depth > 0:
+            self.send_batch_segments()
         self.ctrl_dc(False)
-        self.spi_dev_transmit([cmd])
+        response = self.spi_dev_transmit([cmd] + [0x00] * n_bytes)
+        return response[1:]
+
+    # Read back w*h pixels of GRAM, the panel returns a dummy byte then 3 bytes (RGB666) per pixel
+    def read_pixels(self, x, y, w, h):
+        with self.batch():
+            self.set_address_window(x, y, x + w - 1, y + h - 1)
+        response = self.read_command(0x2E, 1 + w * h * 3)
+        return response[1:]
 
     def write_data(self, data_list):
+        self.send(True, data_list)
+
+    # Stream pixel_count pixels of one color without building the whole buffer
+    def write_fill(self, color, pixel_count):
+        block_pixels = min(pixel_count, ILI9341_FILL_BLOCK_PIXELS)
+        block = bytes(((color >> 8) & 0xFF, color & 0xFF)) * block_pixels
+        if self.batch_depth > 0:
+            if pixel_count <= ILI9341_FILL_BLOCK_PIXELS:
+                self.write_data(block)
+                return
+            # Large fills are streamed, send what was recorded so far first
+            self.send_batch_segments()
         self.ctrl_dc(True)
-        self.spi_dev_transmit(data_list)
+        while pixel_count >= block_pixels:
+            self.spi_dev_write(block)
+            pixel_count -= block_pixels
+        if pixel_count > 0:
+            self.spi_dev_write(block[:pixel_count * 2])
 
     def set_address_window(self, x0, y0, x1, y1):
         # Column addr set
-        self.write_command(0x2A)
-        data_list = [(x0 >> 8) & 0xFF, x0 & 0xFF, (x1 >> 8) & 0xFF, x1 & 0xFF]
-        self.write_data(data_list)
+        if self.window_columns != (x0, x1):
+            self.write_command(0x2A)
+            self.write_data(bytes(((x0 >> 8) & 0xFF, x0 & 0xFF, (x1 >> 8) & 0xFF, x1 & 0xFF)))
+            self.window_columns = (x0, x1)
 
         # Row addr set
-        self.write_command(0x2B)
-        data_list = [(y0 >> 8) & 0xFF, y0 & 0xFF, (y1 >> 8) & 0xFF, y1 & 0xFF]
-        self.write_data(data_list)
+        if self.window_rows != (y0, y1):
+            self.write_command(0x2B)
+            self.write_data(bytes(((y0 >> 8) & 0xFF, y0 & 0xFF, (y1 >> 8) & 0xFF, y1 & 0xFF)))
+            self.window_rows = (y0, y1)
 
         # Write to RAM
         self.write_command(0x2C)
 
     def init(self):
+        start_time = time.monotonic()
+        self.dc_state = None
         self.reset_lcd()
-        self.write_command(0x01)
-        time.sleep(1)
-
-        self.write_command(0xCB)
-        data_list = [0x39, 0x2C, 0x00, 0x34, 0x02]
-        self.write_data(data_list)
-
-        self.write_command(0xCF)
-        data_list = [0x00, 0xC1, 0x30]
-        self.write_data(data_list)
-
-        self.write_command(0xE8)
-        data_list = [0x85, 0x00, 0x78]
-        self.write_data(data_list)
-
-        self.write_command(0xEA)
-        data_list = [0x00, 0x00]
-        self.write_data(data_list)
-
-        self.write_command(0xED)
-        data_list = [0x64, 0x03, 0x12, 0x81]
-        self.write_data(data_list)
-
-        self.write_command(0xF7)
-        data_list = [0x20]
-        self.write_data(data_list)
-
-        self.write_command(0xC0)
-        data_list = [0x23]
-        self.write_data(data_list)
-
-        self.write_command(0xC1)
-        data_list = [0x10]
-        self.write_data(data_list)
-
-        self.write_command(0xC5)
-        data_list = [0x3E, 0x28]
-        self.write_data(data_list)
-
-        self.write_command(0xC7)
-        data_list = [0x86]
-        self.write_data(data_list)
-
-        self.write_command(0x36)
-        data_list = [0x48]
-        self.write_data(data_list)
-
-        self.write_command(0x3A)
-        data_list = [0x55]
-        self.write_data(data_list)
-
-        self.write_command(0xB1)
-        data_list = [0x00, 0x18]
-        self.write_data(data_list)
+        reset_time = time.monotonic()
 
-        self.write_command(0xB6)
-        data_list = [0x08, 0x82, 0x27]
-        self.write_data(data_list)
-
-        self.write_command(0xF2)
-        data_list = [0x00]
-        self.write_data(data_list)
-
-        self.write_command(0x26)
-        data_list = [0x01]
-        self.write_data(data_list)
-
-        self.write_command(0xE0)
-        data_list = [0x0F, 0x31, 0x2B, 0x0C, 0x0E, 0x08, 0x4E, 0xF1,
-                            0x37, 0x07, 0x10, 0x03, 0x0E, 0x09, 0x00]
-        self.write_data(data_list)
-
-        self.write_command(0xE1)
-        data_list = [0x00, 0x0E, 0x14, 0x03, 0x11, 0x07, 0x31, 0xC1,
-                            0x48, 0x08, 0x0F, 0x0C, 0x31, 0x36, 0x0F]
-        self.write_data(data_list)
-
-        self.write_command(0x11)
-        self.delay_ms(120)
-
-        self.write_command(0x29)
-        self.write_command(0x36)
         if self.display_rotation == 0:
             lcd_rotation = ILI9341_LANDSCAPE_90
         else:
             lcd_rotation = ILI9341_ROTATION
-        data_list = [lcd_rotation]
-        self.write_data(data_list)
-        
-        print(f"ILI9341 init successfull")
+
+        # Commands between two delays go out as one batch
+        self.begin_batch()
+        for cmd, data_list, delay_ms in ILI9341_INIT_SEQUENCE:
+            if cmd == 0x11:
+                # Sleep out must not be sent within 120 ms of a reset
+                self.send_batch_segments()
+                remaining = ILI9341_RESET_SLEEP_OUT_MS / 1000 - (time.monotonic() - reset_time)
+                if remaining > 0:
+                    time.sleep(remaining)
+            self.write_command(cmd)
+            if cmd == 0x36:
+                data_list = bytes((lcd_rotation,))
+            if data_list:
+                self.write_data(data_list)
+            if cmd == 0x01:
+                reset_time = time.monotonic()
+            if delay_ms > 0:
+                self.send_batch_segments()
+                self.delay_ms(delay_ms)
+        self.end_batch()
+
+        self.init_time = time.monotonic() - start_time
+        print(f"ILI9341 init successfull ({self.init_time * 1000:.0f} ms)")
 
     def draw_pixel(self, x, y, color):
         if (x >= self.resolution_x) or (y >= self.resolution_y):
             return
-        self.set_address_window(x, y, x+1, y+1)
-        data_list = [color >> 8, color & 0xFF]
-        self.write_data(data_list)
+        if self.framebuffer is not None:
+            self.framebuffer.fill_rectangle(x, y, 1, 1, color)
+            return
+        with self.batch():
+            self.set_address_window(x, y, x, y)
+            self.write_data(bytes(((color >> 8) & 0xFF, color & 0xFF)))
+
+    # Draw the same color at many points, neighbouring pixels on a row share one window
+    def draw_pixels(self, points, color):
+        with self.batch():
+            run_x = None
+            run_y = None
+            run_w = 0
+            for x, y in sorted(set(points), key=lambda point: (point[1], point[0])):
+                if y == run_y and x == run_x + run_w:
+                    run_w += 1
+                    continue
+                if run_w > 0:
+                    self.fill_rectangle(run_x, run_y, run_w, 1, color)
+                run_x, run_y, run_w = x, y, 1
+            if run_w > 0:
+                self.fill_rectangle(run_x, run_y, run_w, 1, color)
+
+    def hline(self, x, y, w, color):
+        self.fill_rectangle(x, y, w, 1, color)
+
+    def vline(self, x, y, h, color):
+        self.fill_rectangle(x, y, 1, h, color)
 
     def fill_rectangle(self, x, y, w, h, color):
         if(x >= self.resolution_x) or (y >= self.resolution_y):
@@ -212,79 +353,153 @@ class ILI9341:
             h = self.resolution_y - y
         if w <= 0 or h <= 0:
             return
-        
-        self.set_address_window(x, y, x+w-1, y+h-1)
-        color_bytes = [(color >> 8) & 0xFF, color & 0xFF]
-        total_pixels = w * h
-        all_pixel_data = []
+        if self.framebuffer is not None:
+            self.framebuffer.fill_rectangle(x, y, w, h, color)
+            return
 
-        for _ in range(total_pixels):
-            all_pixel_data.extend(color_bytes)
-        self.write_data(all_pixel_data)
+        with self.batch():
+            self.set_address_window(x, y, x+w-1, y+h-1)
+            self.write_fill(color, w * h)
 
     def fill_screen(self, color):
         self.fill_rectangle(0, 0, self.resolution_x, self.resolution_y, color)
 
     def write_char(self, x, y, char_code, font, color, bgcolor):
-        char_index_in_data = (ord(char_code) - 32) * font['height']
-        color_on_bytes = [(color >> 8) & 0xFF, color & 0xFF]
-        color_off_bytes = [(bgcolor >> 8) & 0xFF, bgcolor & 0xFF]
-        self.set_address_window(x, y, x + font['width'] - 1, y + font['height'] - 1)
-
-        all_char_pixel_data = []
-        for i in range(font['height']):
-            byte_data_row = font['data'][char_index_in_data + i]
-            for j in range(font['width']):
-                pixel_is_on = (byte_data_row >> (15 - j)) & 0x01
-                if pixel_is_on:
-                    all_char_pixel_data.extend(color_on_bytes)
-                else:
-                    all_char_pixel_data.extend(color_off_bytes)
-
-        self.write_data(all_char_pixel_data)    
+        self.write_run(x, y, char_code, font, color, bgcolor)
+
+    # Write a single line of text through one address window
+    def write_run(self, x, y, text, font, color, bgcolor):
+        if (x >= self.resolution_x) or (y >= self.resolution_y):
+            return
+        max_chars = (self.resolution_x - x) // font['width']
+        text = text[:max_chars]
+        if not text:
+            return
+
+        w = len(text) * font['width']
+        h = font['height']
+        run_pixel_data = self.glyph_cache.render_run(text, font, color, bgcolor)
+        if self.framebuffer is not None:
+            self.framebuffer.blit(x, y, w, h, run_pixel_data)
+            return
+        with self.batch():
+            self.set_address_window(x, y, x + w - 1, y + h - 1)
+            self.write_data(run_pixel_data)
 
     def write_string(self, x, y, string_to_write, font, color, bgcolor):
         current_x = x
         current_y = y
+        run_x = x
+        run_chars = []
 
         for char_val in string_to_write:
             if char_val == '\n' or (current_x + font['width'] > self.resolution_x):
+                self.write_run(run_x, current_y, "".join(run_chars), font, color, bgcolor)
+                run_chars = []
                 current_x = 0
+                run_x = 0
                 current_y += font['height']
                 if current_y + font['height'] > self.resolution_y:
-                    break
-                if char_val == ' ':
+                    return
+                if char_val == ' ' or char_val == '\n':
                     continue
 
-            self.write_char(current_x, current_y, char_val, font, color, bgcolor)
+            run_chars.append(char_val)
             current_x += font['width']
 
+        self.write_run(run_x, current_y, "".join(run_chars), font, color, bgcolor)
+
+    # image can be a PIL image, a NumPy array, a list of 16-bit RGB565 values
+    # or bytes already in big-endian RGB565. w and h are taken from PIL/NumPy input.
+    # Parts outside the panel are clipped
     def draw_image(self, x, y, w, h, image_data_16bit):
-        if (x >= self.resolution_x) or (y >= self.resolution_y):
+        w, h, image_bytes = image.to_rgb565(image_data_16bit, w, h)
+        if w is None or h is None or w <= 0 or h <= 0:
             return
-        if (x + w - 1) >= self.resolution_x:
+        if memoryview(image_bytes).nbytes != (w * h * 2):
+            print(f"ILI9341 - image size mismatch, expected {w}x{h}")
             return
-        if (y + h - 1) >= self.resolution_y:
+        self.blit(x, y, w, h, image_bytes)
+
+    # Stream a raw big-endian RGB565 file (see image.py) straight from a memory map
+    def draw_image_file(self, x, y, w, h, path):
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as image_map:
+                if len(image_map) != (w * h * 2):
+                    print(f"ILI9341 - {path} is not a {w}x{h} RGB565 image")
+                    return
+                image_view = memoryview(image_map)
+                try:
+                    self.blit(x, y, w, h, image_view)
+                finally:
+                    image_view.release()
+
+    # Copy a w x h block of big-endian RGB565 pixels to (x, y), clipped to the panel
+    def blit(self, x, y, w, h, pixel_data):
+        if self.framebuffer is not None:
+            self.framebuffer.blit(x, y, w, h, pixel_data)
             return
 
-        if w <= 0 or h <= 0:
+        x0 = max(0, x)
+        y0 = max(0, y)
+        x1 = min(self.resolution_x, x + w)
+        y1 = min(self.resolution_y, y + h)
+        if x1 <= x0 or y1 <= y0:
             return
-
-        if len(image_data_16bit) != (w * h):
-            return
-
-        self.set_address_window(x, y, x + w - 1, y + h - 1)
-
-        all_image_pixel_bytes = []
-        for pixel_color_16bit in image_data_16bit:
-            all_image_pixel_bytes.append((pixel_color_16bit >> 8) & 0xFF)
-            all_image_pixel_bytes.append(pixel_color_16bit & 0xFF)
-
-        self.write_data(all_image_pixel_bytes)
+        src = memoryview(pixel_data).cast('B')
+        src_stride = w * 2
+        with self.batch():
+            self.set_address_window(x0, y0, x1 - 1, y1 - 1)
+            if x0 == x and x1 == x + w:
+                # Full rows are contiguous in the source
+                self.write_data(src[(y0 - y) * src_stride : (y1 - y) * src_stride])
+            else:
+                for row in range(y0 - y, y1 - y):
+                    start = row * src_stride + (x0 - x) * 2
+                    self.write_data(src[start : start + (x1 - x0) * 2])
 
     def invert_color(self, invert):
         self.write_command(0x21 if invert else 0x20)    
 
+    # Hardware scrolling works on the 320 gate lines of the panel, that is the
+    # y axis in portrait and the x axis in the landscape mode used by smart_node.
+    # The three areas are given in lines and must add up to ILI9341_SCROLL_LINES
+    def define_scroll_area(self, top_fixed, scroll_height, bottom_fixed):
+        if top_fixed + scroll_height + bottom_fixed != ILI9341_SCROLL_LINES:
+            print(f"ILI9341 - scroll areas must add up to {ILI9341_SCROLL_LINES} lines")
+            return False
+        with self.batch():
+            self.write_command(0x33)
+            self.write_data(bytes(((top_fixed >> 8) & 0xFF, top_fixed & 0xFF,
+                                   (scroll_height >> 8) & 0xFF, scroll_height & 0xFF,
+                                   (bottom_fixed >> 8) & 0xFF, bottom_fixed & 0xFF)))
+        return True
+
+    # Show memory line `line` at the top of the scroll area
+    def scroll_to(self, line):
+        with self.batch():
+            self.write_command(0x37)
+            self.write_data(bytes(((line >> 8) & 0xFF, line & 0xFF)))
+
+    def stop_scroll(self):
+        self.scroll_to(0)
+        # Normal display mode on leaves vertical scrolling mode
+        self.write_command(0x13)
+
+    # Send only the regions of the framebuffer that changed since the last flush.
+    # Return number of pixel bytes sent to the panel
+    def flush(self):
+        if self.framebuffer is None:
+            return 0
+        bytes_sent = 0
+        with self.batch():
+            for x, y, w, h in self.framebuffer.dirty_rectangles():
+                self.set_address_window(x, y, x + w - 1, y + h - 1)
+                self.write_data(self.framebuffer.get_rectangle(x, y, w, h))
+                bytes_sent += w * h * 2
+        self.framebuffer.mark_synced()
+        return bytes_sent
+
 
 if __name__ == "__main__":
     print("Test ILI9341")
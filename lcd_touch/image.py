@@ -0,0 +1,88 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# image.py
+# Convert images to the big-endian RGB565 bytes ili9341 expects
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import mmap
+import sys
+from array import array
+
+# Byte translation tables, RGB565 high byte is RRRRRGGG, low byte is GGGBBBBB
+RGB565_RED_HIGH = bytes(v & 0xF8 for v in range(256))
+RGB565_GREEN_HIGH = bytes(v >> 5 for v in range(256))
+RGB565_GREEN_LOW = bytes((v << 3) & 0xE0 for v in range(256))
+RGB565_BLUE_LOW = bytes(v >> 3 for v in range(256))
+
+def color_rgb(r, g, b):
+    r = max(0, min(255, r))
+    g = max(0, min(255, g))
+    b = max(0, min(255, b))
+    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | ((b & 0xF8) >> 3)
+
+def or_bytes(a, b):
+    # Bitwise OR of two equal length byte strings, done on big ints in C
+    return (int.from_bytes(a, 'big') | int.from_bytes(b, 'big')).to_bytes(len(a), 'big')
+
+# Packed RGB888 (3 bytes per pixel) to big-endian RGB565
+def rgb888_to_rgb565(data):
+    data = bytes(data)
+    red = data[0::3]
+    green = data[1::3]
+    blue = data[2::3]
+    result = bytearray(len(red) * 2)
+    result[0::2] = or_bytes(red.translate(RGB565_RED_HIGH), green.translate(RGB565_GREEN_HIGH))
+    result[1::2] = or_bytes(green.translate(RGB565_GREEN_LOW), blue.translate(RGB565_BLUE_LOW))
+    return result
+
+# Sequence of 16-bit RGB565 ints to big-endian bytes
+def rgb565_values_to_bytes(values):
+    result = array('H', values)
+    if sys.byteorder == 'little':
+        result.byteswap()
+    return result
+
+def is_pil_image(image):
+    return hasattr(image, 'convert') and hasattr(image, 'size') and hasattr(image, 'tobytes')
+
+def is_numpy_array(image):
+    return hasattr(image, 'shape') and hasattr(image, 'dtype') and hasattr(image, 'astype')
+
+# Return (w, h, data) with data as big-endian RGB565 bytes. Accept a PIL image,
+# a NumPy array (h x w uint16 RGB565 or h x w x 3/4 uint8 RGB), a sequence of
+# RGB565 ints or a bytes-like object already in panel format
+def to_rgb565(image, w=None, h=None):
+    if is_pil_image(image):
+        w, h = image.size
+        return w, h, rgb888_to_rgb565(image.convert('RGB').tobytes())
+
+    if is_numpy_array(image):
+        if len(image.shape) == 2:
+            h, w = image.shape
+            return w, h, image.astype('>u2').tobytes()
+        if len(image.shape) == 3 and image.shape[2] in (3, 4) and image.dtype.itemsize == 1:
+            h, w = image.shape[:2]
+            return w, h, rgb888_to_rgb565(image[:, :, :3].tobytes())
+        raise ValueError(f"Unsupported image array shape {image.shape} / {image.dtype}")
+
+    if isinstance(image, (bytes, bytearray, memoryview, mmap.mmap)):
+        return w, h, image
+    return w, h, rgb565_values_to_bytes(image)
+
+def write_rgb565_file(path, image):
+    w, h, data = to_rgb565(image)
+    with open(path, "wb") as f:
+        f.write(data)
+    return w, h
+
+
+if __name__ == "__main__":
+    # Convert an image to a raw RGB565 file for ILI9341.draw_image_file
+    from PIL import Image
+    if len(sys.argv) != 3:
+        print("Usage: image.py <input image> <output .raw>")
+        sys.exit(1)
+    w, h = write_rgb565_file(sys.argv[2], Image.open(sys.argv[1]))
+    print(f"Wrote {w}x{h} RGB565 image to {sys.argv[2]}")
@@ -0,0 +1,73 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# renderer.py
+# Background thread that applies draw requests to ili9341
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import threading
+
+class DisplayRenderer:
+    def __init__(self, lcd):
+        self.lcd = lcd
+        # key -> (func, args). A newer request with the same key replaces the
+        # pending one, so a slow panel never builds up a backlog
+        self.pending_requests = {}
+        self.condition = threading.Condition()
+        self.is_running = False
+        self.thread = None
+
+        self.requests_posted = 0
+        self.requests_coalesced = 0
+        self.requests_applied = 0
+        # Set each time a round of requests has been sent to the panel
+        self.frame_rendered = threading.Event()
+
+    def post(self, key, func, *args):
+        with self.condition:
+            if key in self.pending_requests:
+                # Latest wins, and it is applied after anything posted before it
+                del self.pending_requests[key]
+                self.requests_coalesced += 1
+            self.pending_requests[key] = (func, args)
+            self.requests_posted += 1
+            self.condition.notify()
+
+    def post_text(self, field, text):
+        self.post(field, field.update, text)
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.is_running = False
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.is_running and not self.pending_requests:
+                    self.condition.wait()
+                if not self.pending_requests:
+                    return
+                requests = self.pending_requests
+                self.pending_requests = {}
+
+            with self.lcd.batch():
+                for func, args in requests.values():
+                    try:
+                        func(*args)
+                    except Exception as e:
+                        print(f"Display renderer error: {e}")
+                    self.requests_applied += 1
+                self.lcd.flush()
+            self.frame_rendered.set()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# screen_template.py
+# Static screen content rendered once, sent as fills and the item rows
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from .framebuffer import FrameBuffer
+from .glyph_cache import GlyphCache
+
+class ScreenTemplate:
+    def __init__(self, width, height, bgcolor):
+        self.width = width
+        self.height = height
+        self.bgcolor = bgcolor
+        self.items = []
+        self.framebuffer = None
+
+    def add_text(self, x, y, text, font, color, bgcolor):
+        self.items.append(('text', x, y, text, font, color, bgcolor))
+        self.framebuffer = None
+
+    def add_rectangle(self, x, y, w, h, color):
+        self.items.append(('rectangle', x, y, w, h, color))
+        self.framebuffer = None
+
+    def render(self, glyph_cache=None):
+        if self.framebuffer is not None:
+            return self.framebuffer
+        if glyph_cache is None:
+            glyph_cache = GlyphCache()
+
+        framebuffer = FrameBuffer(self.width, self.height)
+        framebuffer.fill_rectangle(0, 0, self.width, self.height, self.bgcolor)
+        for item in self.items:
+            if item[0] == 'text':
+                _, x, y, text, font, color, bgcolor = item
+                run_pixel_data = glyph_cache.render_run(text, font, color, bgcolor)
+                framebuffer.blit(x, y, len(text) * font['width'], font['height'], run_pixel_data)
+            else:
+                _, x, y, w, h, color = item
+                framebuffer.fill_rectangle(x, y, w, h, color)
+        self.framebuffer = framebuffer
+        return framebuffer
+
+    # Full width row bands covering the items, top to bottom, overlapping bands merged
+    def item_bands(self):
+        bands = []
+        for item in self.items:
+            if item[0] == 'text':
+                _, x, y, text, font, _, _ = item
+                rect = (x, y, len(text) * font['width'], font['height'])
+            else:
+                rect = item[1:5]
+            rect = self.framebuffer.clip(*rect)
+            if rect is not None:
+                bands.append([rect[1], rect[1] + rect[3]])
+        bands.sort()
+        merged = []
+        for band in bands:
+            if merged and band[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], band[1])
+            else:
+                merged.append(band)
+        return merged
+
+    # Rows without items go out as streamed fills of the background and only
+    # the item bands are copied from the rendered buffer, so no pixel is sent
+    # twice. In framebuffer mode the panel is drawn directly and the rendered
+    # buffer becomes the synced framebuffer content, so flush() sends nothing
+    def show(self, lcd):
+        framebuffer = self.render(lcd.glyph_cache)
+        row = 0
+        with lcd.direct(), lcd.batch():
+            for top, bottom in self.item_bands() + [[self.height, self.height]]:
+                if top > row:
+                    lcd.fill_rectangle(0, row, self.width, top - row, self.bgcolor)
+                if bottom > top:
+                    lcd.blit(0, top, self.width, bottom - top, framebuffer.get_rectangle(0, top, self.width, bottom - top))
+                row = max(row, bottom)
+        if lcd.framebuffer is not None:
+            lcd.framebuffer.buffer[:] = framebuffer.buffer
+            lcd.framebuffer.mark_synced()
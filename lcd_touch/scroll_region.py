@@ -0,0 +1,41 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# scroll_region.py
+# Append lines to an area that scrolls with the ili9341 scroll registers
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from .ili9341 import ILI9341_SCROLL_LINES
+
+class ScrollRegion:
+    # start and size are in panel lines along the scroll axis (see
+    # ILI9341.define_scroll_area), lines outside the region stay fixed
+    def __init__(self, lcd, start, size):
+        self.lcd = lcd
+        self.start = start
+        self.size = size
+        # Offset of the oldest line, it is shown first in the region
+        self.offset = 0
+
+        if not lcd.define_scroll_area(start, size, ILI9341_SCROLL_LINES - start - size):
+            raise ValueError("Invalid scroll region")
+        lcd.scroll_to(start)
+
+    # Overwrite the oldest n_lines with new content and scroll them into view as
+    # the newest lines. draw_func(position, n) is called with the memory position
+    # along the scroll axis, twice if the block wraps around the end of the region
+    def append(self, n_lines, draw_func):
+        n_lines = min(n_lines, self.size)
+        first_part = min(n_lines, self.size - self.offset)
+        draw_func(self.start + self.offset, first_part)
+        if first_part < n_lines:
+            draw_func(self.start, n_lines - first_part)
+        self.offset = (self.offset + n_lines) % self.size
+        # New lines must be in panel memory before they scroll into view
+        self.lcd.flush()
+        self.lcd.scroll_to(self.start + self.offset)
+
+    def reset(self):
+        self.offset = 0
+        self.lcd.scroll_to(self.start)
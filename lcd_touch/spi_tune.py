@@ -0,0 +1,187 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# spi_tune.py
+# Find the fastest reliable SPI clock for ili9341 / xpt2046 and
+# benchmark the display
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import json
+import os
+import random
+import time
+
+SPI_CLOCK_FILE = "spi_clock.json"
+
+ILI9341_SPI_CANDIDATE_HZ = (500000, 1000000, 2000000, 4000000, 8000000, 16000000,
+                            24000000, 32000000, 40000000, 50000000, 62500000)
+XPT2046_SPI_CANDIDATE_HZ = (125000, 250000, 500000, 1000000, 1500000, 2000000, 2500000)
+
+# Test pattern is written to this corner of the panel and read back
+SPI_TUNE_WINDOW_W = 16
+SPI_TUNE_WINDOW_H = 8
+SPI_TUNE_TRIALS = 3
+
+# XPT2046 temperature channel (single ended, 12 bit), stable enough to compare rates
+XPT2046_READ_TEMP0 = 0x84
+XPT2046_TEMP_TOLERANCE = 16
+
+def load_spi_clock(path=SPI_CLOCK_FILE):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"SPI clock file error: {e}")
+        return {}
+
+def save_spi_clock(values, path=SPI_CLOCK_FILE):
+    spi_clock = load_spi_clock(path)
+    spi_clock.update(values)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(spi_clock, f, indent=2)
+    os.replace(tmp_path, path)
+
+def make_test_pattern(n_pixels, seed):
+    rng = random.Random(seed)
+    return bytes(rng.getrandbits(8) for _ in range(n_pixels * 2))
+
+def write_test_pattern(lcd, pattern):
+    with lcd.batch():
+        lcd.set_address_window(0, 0, SPI_TUNE_WINDOW_W - 1, SPI_TUNE_WINDOW_H - 1)
+        lcd.write_data(pattern)
+
+# Highest rate at which every lower rate also passed
+def highest_passing_rate(candidates, check):
+    best_hz = None
+    for speed_hz in candidates:
+        if not all(check(speed_hz, trial) for trial in range(SPI_TUNE_TRIALS)):
+            print(f"  {speed_hz / 1e6:6.2f} MHz: FAIL")
+            break
+        print(f"  {speed_hz / 1e6:6.2f} MHz: ok")
+        best_hz = speed_hz
+    return best_hz
+
+# Write test patterns at each candidate clock and read them back at the base
+# clock (the panel read cycle is much slower than its write cycle)
+def calibrate_display_clock(lcd, candidates=ILI9341_SPI_CANDIDATE_HZ):
+    base_hz = candidates[0]
+    lcd.set_spi_speed(base_hz)
+    display_id = lcd.read_command(0x04, 4)
+    if all(b == 0x00 for b in display_id) or all(b == 0xFF for b in display_id):
+        print("ILI9341 - no readback data, is SDO (MISO) connected?")
+        return None
+
+    n_pixels = SPI_TUNE_WINDOW_W * SPI_TUNE_WINDOW_H
+    blank = bytes(n_pixels * 2)
+    references = {}
+
+    def check(speed_hz, trial):
+        pattern = make_test_pattern(n_pixels, trial)
+        if trial not in references:
+            lcd.set_spi_speed(base_hz)
+            write_test_pattern(lcd, pattern)
+            references[trial] = lcd.read_pixels(0, 0, SPI_TUNE_WINDOW_W, SPI_TUNE_WINDOW_H)
+        lcd.set_spi_speed(base_hz)
+        write_test_pattern(lcd, blank)
+        lcd.set_spi_speed(speed_hz)
+        write_test_pattern(lcd, pattern)
+        lcd.set_spi_speed(base_hz)
+        return lcd.read_pixels(0, 0, SPI_TUNE_WINDOW_W, SPI_TUNE_WINDOW_H) == references[trial]
+
+    print("ILI9341 - SPI clock calibration")
+    best_hz = highest_passing_rate(candidates, check)
+    lcd.set_spi_speed(best_hz if best_hz is not None else base_hz)
+    if lcd.framebuffer is not None:
+        lcd.framebuffer.invalidate()
+    return best_hz
+
+def read_touch_channel(touch, cmd):
+    response = touch.spi_dev_transmit([cmd, 0x00, 0x00])
+    if len(response) < 3:
+        return None
+    # The first bit after the command is always 0 on a sane transfer
+    if response[1] & 0x80:
+        return None
+    return ((response[1] << 8) | response[2]) >> 3
+
+def calibrate_touch_clock(touch, candidates=XPT2046_SPI_CANDIDATE_HZ):
+    base_hz = candidates[0]
+    touch.set_spi_speed(base_hz)
+    reference = read_touch_channel(touch, XPT2046_READ_TEMP0)
+    if reference is None or reference in (0, 0xFFF):
+        print("XPT2046 - no readback data, is DOUT (MISO) connected?")
+        return None
+
+    def check(speed_hz, trial):
+        touch.set_spi_speed(speed_hz)
+        value = read_touch_channel(touch, XPT2046_READ_TEMP0)
+        return value is not None and abs(value - reference) <= XPT2046_TEMP_TOLERANCE
+
+    print("XPT2046 - SPI clock calibration")
+    best_hz = highest_passing_rate(candidates, check)
+    touch.set_spi_speed(best_hz if best_hz is not None else base_hz)
+    return best_hz
+
+def benchmark_display(lcd, duration=2.0, font=None):
+    def run(name, draw, pixel_bytes):
+        count = 0
+        start = time.monotonic()
+        while time.monotonic() - start < duration:
+            draw(count)
+            lcd.flush()
+            count += 1
+        elapsed = time.monotonic() - start
+        results[name] = {
+            "per_sec": count / elapsed,
+            "mb_per_sec": count * pixel_bytes / elapsed / 1e6,
+        }
+
+    results = {}
+    colors = (0xF800, 0x07E0, 0x001F, 0x0000)
+    run("fill_screen",
+        lambda i: lcd.fill_screen(colors[i % len(colors)]),
+        lcd.resolution_x * lcd.resolution_y * 2)
+
+    if font is not None:
+        text = "0123456789:.-"
+        run("text_line",
+            lambda i: lcd.write_run(0, 0, text, font, colors[i % len(colors)], 0x0000),
+            len(text) * font['width'] * font['height'] * 2)
+
+    image_w = 64
+    image_h = 64
+    images = [[(i * 0x0841 + p) & 0xFFFF for p in range(image_w * image_h)] for i in range(2)]
+    run("image_64x64",
+        lambda i: lcd.draw_image(0, 0, image_w, image_h, images[i % 2]),
+        image_w * image_h * 2)
+
+    print(f"ILI9341 benchmark at {lcd.spi_dev.max_speed_hz / 1e6:.2f} MHz")
+    for name, result in results.items():
+        print(f"  {name:12}: {result['per_sec']:8.1f} /s {result['mb_per_sec']:7.3f} MB/s")
+    return results
+
+
+if __name__ == "__main__":
+    from lcd_touch import ili9341
+    from lcd_touch import xpt2046
+
+    ili9341_obj = ili9341.ILI9341(18, 23, 0, 320, 240, 0)
+    ili9341_obj.init()
+    xpt2046_obj = xpt2046.XPT2046(320, 240, 22, 1)
+
+    spi_clock = {}
+    display_hz = calibrate_display_clock(ili9341_obj)
+    if display_hz is not None:
+        spi_clock["ili9341"] = display_hz
+    touch_hz = calibrate_touch_clock(xpt2046_obj)
+    if touch_hz is not None:
+        spi_clock["xpt2046"] = touch_hz
+    if spi_clock:
+        save_spi_clock(spi_clock)
+        print(f"Saved {spi_clock} to {SPI_CLOCK_FILE}")
+
+    benchmark_display(ili9341_obj, font=ili9341.font.font_11x18)
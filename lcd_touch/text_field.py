@@ -0,0 +1,58 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# text_field.py
+# Fixed position text field that only redraws changed characters
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+
+class TextField:
+    def __init__(self, lcd, x, y, width, font, color, bgcolor):
+        self.lcd = lcd
+        self.x = x
+        self.y = y
+        self.width = width      # number of character cells
+        self.font = font
+        self.color = color
+        self.bgcolor = bgcolor
+        # Characters currently on screen, None until the first update
+        self.text = None
+
+    def invalidate(self):
+        self.text = None
+
+    def set_colors(self, color, bgcolor):
+        if color != self.color or bgcolor != self.bgcolor:
+            self.color = color
+            self.bgcolor = bgcolor
+            self.invalidate()
+
+    # Return number of character cells redrawn
+    def update(self, text):
+        text = text[:self.width]
+        if self.text is None:
+            old_text = None
+            new_text = text.ljust(self.width)
+        else:
+            old_text = self.text
+            # Only blank the trailing cells that the new text no longer covers
+            new_text = text.ljust(len(old_text))
+
+        cells_drawn = 0
+        run_start = None
+        for i in range(len(new_text) + 1):
+            changed = (i < len(new_text) and
+                       (old_text is None or i >= len(old_text) or old_text[i] != new_text[i]))
+            if changed:
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                self.lcd.write_run(self.x + run_start * self.font['width'], self.y,
+                                   new_text[run_start:i], self.font, self.color, self.bgcolor)
+                cells_drawn += i - run_start
+                run_start = None
+
+        # Trailing blank cells need no tracking, they match an empty cell
+        self.text = new_text.rstrip(' ')
+        return cells_drawn
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# touch_calibration.py
+# 3-point affine calibration for xpt2046 on ili9341
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import json
+import os
+import time
+
+from .xpt2046 import trimmed_mean
+
+TOUCH_CALIBRATION_FILE = "touch_calibration.json"
+# Targets as fractions of the screen size, spread out and not on one line
+TOUCH_CALIBRATION_TARGETS = ((0.1, 0.1), (0.9, 0.5), (0.5, 0.9))
+TOUCH_CALIBRATION_CROSS_SIZE = 10
+TOUCH_CALIBRATION_TIMEOUT = 30
+
+def determinant3(m):
+    return (m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1]) -
+            m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0]) +
+            m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0]))
+
+# Solve screen = A * raw for the affine coefficients (a, b, c, d, e, f) with
+# Cramer's rule, from three (raw_x, raw_y) and three (x, y) points
+def compute_affine(raw_points, screen_points):
+    matrix = [[raw_x, raw_y, 1.0] for raw_x, raw_y in raw_points]
+    det = determinant3(matrix)
+    if abs(det) < 1e-9:
+        raise ValueError("Calibration points are on one line")
+
+    coefficients = []
+    for axis in range(2):
+        targets = [point[axis] for point in screen_points]
+        for column in range(3):
+            replaced = [row[:] for row in matrix]
+            for row in range(3):
+                replaced[row][column] = targets[row]
+            coefficients.append(determinant3(replaced) / det)
+    return tuple(coefficients)
+
+def load_calibration(path=TOUCH_CALIBRATION_FILE):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path) as f:
+            calibration = json.load(f)["xpt2046"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Touch calibration file error: {e}")
+        return None
+    if len(calibration) != 6:
+        return None
+    return tuple(calibration)
+
+def save_calibration(calibration, path=TOUCH_CALIBRATION_FILE):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"xpt2046": list(calibration)}, f, indent=2)
+    os.replace(tmp_path, path)
+
+def draw_cross(lcd, x, y, color):
+    half = TOUCH_CALIBRATION_CROSS_SIZE
+    lcd.hline(x - half, y, 2 * half + 1, color)
+    lcd.vline(x, y - half, 2 * half + 1, color)
+    lcd.flush()
+
+# Wait for a press, return its raw position once the pen is lifted again
+def wait_raw_touch(touch, timeout):
+    deadline = time.monotonic() + timeout
+    samples = []
+    while time.monotonic() < deadline:
+        success, raw_x, raw_y, _ = touch.get_raw_touch()
+        if success:
+            samples.append((raw_x, raw_y))
+        elif samples and not touch.is_touched():
+            return trimmed_mean([x for x, _ in samples]), trimmed_mean([y for _, y in samples])
+        time.sleep(0.01)
+    return None
+
+# Show a cross at each target, read the touch and store the result
+def run_calibration(lcd, touch, path=TOUCH_CALIBRATION_FILE, color=0xFFFF, bgcolor=0x0000):
+    raw_points = []
+    screen_points = []
+    lcd.fill_screen(bgcolor)
+    for fx, fy in TOUCH_CALIBRATION_TARGETS:
+        x = int(fx * lcd.resolution_x)
+        y = int(fy * lcd.resolution_y)
+        draw_cross(lcd, x, y, color)
+        raw_point = wait_raw_touch(touch, TOUCH_CALIBRATION_TIMEOUT)
+        draw_cross(lcd, x, y, bgcolor)
+        if raw_point is None:
+            print("Touch calibration timed out")
+            return None
+        raw_points.append(raw_point)
+        screen_points.append((x, y))
+
+    calibration = compute_affine(raw_points, screen_points)
+    touch.set_calibration(calibration)
+    save_calibration(calibration, path)
+    print(f"Touch calibration saved to {path}")
+    return calibration
+
+
+if __name__ == "__main__":
+    from lcd_touch import ili9341
+    from lcd_touch import xpt2046
+
+    ili9341_obj = ili9341.ILI9341(18, 23, 0, 320, 240, 0)
+    ili9341_obj.init()
+    xpt2046_obj = xpt2046.XPT2046(320, 240, 22, 1)
+    run_calibration(ili9341_obj, xpt2046_obj)
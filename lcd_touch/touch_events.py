@@ -0,0 +1,142 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# touch_events.py
+# Touch down/move/up events for xpt2046, driven by the PENIRQ pin
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import queue
+import threading
+import time
+from collections import namedtuple
+
+TOUCH_DOWN = "down"
+TOUCH_MOVE = "move"
+TOUCH_UP = "up"
+
+TOUCH_SAMPLE_RATE_HZ = 100
+TOUCH_DEBOUNCE_MS = 10
+TOUCH_MOVE_THRESHOLD = 2       # pixels
+TOUCH_QUEUE_SIZE = 64
+
+# timestamp is time.monotonic() when the sample was taken
+TouchEvent = namedtuple("TouchEvent", ["type", "x", "y", "timestamp"])
+
+class TouchEventEngine:
+    def __init__(self, touch, sample_rate_hz=TOUCH_SAMPLE_RATE_HZ, debounce_ms=TOUCH_DEBOUNCE_MS,
+                 move_threshold=TOUCH_MOVE_THRESHOLD, queue_size=TOUCH_QUEUE_SIZE):
+        self.touch = touch
+        self.sample_period = 1 / sample_rate_hz
+        self.debounce = debounce_ms / 1000
+        self.move_threshold = move_threshold
+        self.events = queue.Queue(maxsize=queue_size)
+        self.events_dropped = 0
+
+        self.irq_event = threading.Event()
+        self.is_running = False
+        self.thread = None
+        # PENIRQ goes low (active) when the panel is pressed
+        self.touch.irq_pin_status.when_activated = self.irq_event.set
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self.irq_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    # Return next TouchEvent, or None if nothing arrived within timeout
+    def get_event(self, timeout=None):
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def emit(self, event_type, x, y, timestamp):
+        event = TouchEvent(event_type, x, y, timestamp)
+        while True:
+            try:
+                self.events.put_nowait(event)
+                return
+            except queue.Full:
+                pass
+            # Keep the newest events, a slow consumer loses the oldest. The
+            # consumer may empty the queue in between, then just try again
+            try:
+                self.events.get_nowait()
+                self.events_dropped += 1
+            except queue.Empty:
+                pass
+
+    def run(self):
+        while self.is_running:
+            if not self.touch.is_touched():
+                # Sleep until the IRQ edge, no polling while idle
+                self.irq_event.wait()
+            self.irq_event.clear()
+            if not self.is_running:
+                break
+            time.sleep(self.debounce)
+            if self.touch.is_touched():
+                self.track_touch()
+            # Conversions toggle PENIRQ, ignore edges seen while tracking
+            self.irq_event.clear()
+
+    def track_touch(self):
+        is_down = False
+        last_x = 0
+        last_y = 0
+        released_at = None
+        next_sample = time.monotonic()
+
+        while self.is_running:
+            now = time.monotonic()
+            if self.touch.is_touched():
+                released_at = None
+                success, x, y = self.touch.get_touch_coordinate()
+                if success:
+                    if not is_down:
+                        self.emit(TOUCH_DOWN, x, y, now)
+                        is_down = True
+                        last_x, last_y = x, y
+                    elif abs(x - last_x) >= self.move_threshold or abs(y - last_y) >= self.move_threshold:
+                        self.emit(TOUCH_MOVE, x, y, now)
+                        last_x, last_y = x, y
+            else:
+                if released_at is None:
+                    released_at = now
+                elif now - released_at >= self.debounce:
+                    if is_down:
+                        self.emit(TOUCH_UP, last_x, last_y, now)
+                    return
+
+            next_sample += self.sample_period
+            delay = next_sample - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_sample = time.monotonic()
+
+
+if __name__ == "__main__":
+    from lcd_touch import xpt2046
+
+    IRQ_PIN = 22
+    CHIP_ID = 1     #CE1
+    xpt2046_obj = xpt2046.XPT2046(320, 240, IRQ_PIN, CHIP_ID)
+    engine = TouchEventEngine(xpt2046_obj)
+    engine.start()
+    try:
+        while True:
+            event = engine.get_event()
+            print(f"{event.timestamp:.3f} {event.type:4} X={event.x}, Y={event.y}")
+    except KeyboardInterrupt:
+        engine.stop()
@@ -0,0 +1,102 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# trend_chart.py
+# Sweeping sparkline of the latest samples, drawn column by column
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import math
+import threading
+from array import array
+
+class TrendChart:
+    # One sample per pixel column. scale_step is the granularity of the
+    # autoscale limits, the chart is only fully redrawn when they change
+    def __init__(self, lcd, x, y, w, h, color, bgcolor, scale_step=1.0):
+        self.lcd = lcd
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.color = color
+        self.bgcolor = bgcolor
+        self.scale_step = scale_step
+
+        # Ring buffer, head is the column the next sample goes to
+        self.values = array('f', bytes(4 * w))
+        self.head = 0
+        self.count = 0
+        self.dirty_columns = set()
+        self.lock = threading.Lock()
+
+        self.scale_min = None
+        self.scale_max = None
+        self.full_redraws = 0
+
+    # Cheap, can be called from the sampling thread. render() does the drawing
+    def add(self, value):
+        with self.lock:
+            self.values[self.head] = value
+            self.dirty_columns.add(self.head)
+            self.head = (self.head + 1) % self.w
+            self.count = min(self.count + 1, self.w)
+
+    def compute_scale(self, values):
+        low = min(values)
+        high = max(values)
+        scale_min = math.floor(low / self.scale_step) * self.scale_step
+        scale_max = math.ceil(high / self.scale_step) * self.scale_step
+        if scale_max <= scale_min:
+            scale_max = scale_min + self.scale_step
+        return scale_min, scale_max
+
+    def value_to_row(self, value):
+        ratio = (value - self.scale_min) / (self.scale_max - self.scale_min)
+        return self.y + self.h - 1 - int(round(ratio * (self.h - 1)))
+
+    # oldest is the column of the oldest sample, it is not joined to the
+    # newest one on its left
+    def draw_column(self, index, values, count, oldest, erase=True):
+        column_x = self.x + index
+        if erase:
+            self.lcd.vline(column_x, self.y, self.h, self.bgcolor)
+        if index >= count:
+            return
+        row = self.value_to_row(values[index])
+        # Join to the previous sample so the trend reads as a line
+        previous_index = (index - 1) % self.w
+        if previous_index < count and index != oldest:
+            previous_row = self.value_to_row(values[previous_index])
+        else:
+            previous_row = row
+        top = min(row, previous_row)
+        self.lcd.vline(column_x, top, abs(row - previous_row) + 1, self.color)
+
+    def render(self):
+        with self.lock:
+            if not self.dirty_columns:
+                return
+            values = array('f', self.values)
+            count = self.count
+            oldest = self.head if count == self.w else 0
+            dirty_columns = self.dirty_columns
+            self.dirty_columns = set()
+
+        if count < self.w:
+            scale = self.compute_scale(values[:count])
+        else:
+            scale = self.compute_scale(values)
+        with self.lcd.batch():
+            if scale != (self.scale_min, self.scale_max):
+                self.scale_min, self.scale_max = scale
+                self.full_redraws += 1
+                self.lcd.fill_rectangle(self.x, self.y, self.w, self.h, self.bgcolor)
+                for index in range(count):
+                    self.draw_column(index, values, count, oldest, erase=False)
+                return
+            # The column after a new sample was joined to the value it
+            # replaced, at the sweep boundary that is the oldest column
+            redraw_columns = dirty_columns | {(index + 1) % self.w for index in dirty_columns}
+            for index in sorted(redraw_columns):
+                self.draw_column(index, values, count, oldest)
@@ -6,14 +6,27 @@
 # Author : Phien Nguyen (Mark)
 # Date   : 21 June 2025
 #---------------------------------------------------------------------
-from gpiozero import LED
-from gpiozero import DigitalInputDevice
-import spidev
 import time
 
+from backends.base import create_device
+from buses.spi_bus import SPI_PRIORITY_HIGH
+
 # Swap READ_X, READ_Y depend on orientation of touchscreen
 READ_X = 0x90
 READ_Y = 0xD0
+READ_Z1 = 0xB0
+READ_Z2 = 0xC0
+
+# Samples per reading, all taken in one chained SPI transfer
+XPT2046_SAMPLES = 16
+# Pressure estimate (Z1 + 4095 - Z2) below this is a light or noisy contact
+XPT2046_Z_THRESHOLD = 400
+XPT2046_MIN_VALID_SAMPLES = 4
+# Fraction of the lowest and highest samples dropped before averaging
+XPT2046_TRIM_FRACTION = 0.25
+
+# XPT2046 DCLK is specified up to 2.5 MHz, run lcd_touch/spi_tune.py to tune it
+XPT2046_SPI_SPEED_HZ = 500000
 
 ILI9341_TOUCH_SCALE_X = 320
 ILI9341_TOUCH_SCALE_Y = 240
@@ -24,16 +37,29 @@ ILI9341_TOUCH_MIN_RAW_Y = 3276
 ILI9341_TOUCH_MAX_RAW_Y = 3720
 
 class XPT2046:
-    def __init__(self, resolution_x, resolution_y, irq_pin, chip_id):
+    # calibration_path defaults to touch_calibration.TOUCH_CALIBRATION_FILE
+    def __init__(self, resolution_x, resolution_y, irq_pin, chip_id, spi_speed_hz=XPT2046_SPI_SPEED_HZ, spi_bus=None,
+                 calibration_path=None):
         self.resolution_x = resolution_x
         self.resolution_y = resolution_y
         self.irq_pin = irq_pin
         self.chip_id = chip_id
         
-        self.irq_pin_status = DigitalInputDevice(self.irq_pin, pull_up=True)
-        self.spi_dev = spidev.SpiDev()
-        self.spi_dev.open(0, self.chip_id)
-        self.spi_dev.max_speed_hz = 500000
+        self.irq_pin_status = create_device("gpio_in", self.irq_pin, pull_up=True)
+        # On a shared buses.spi_bus.SPIBus touch reads go ahead of display chunks
+        if spi_bus is not None:
+            self.spi_dev = spi_bus.open_device(self.chip_id, spi_speed_hz, priority=SPI_PRIORITY_HIGH)
+        else:
+            self.spi_dev = create_device("spi", 0, self.chip_id)
+            self.spi_dev.max_speed_hz = spi_speed_hz
+
+        # Saved by touch_calibration.run_calibration, if it was ever run.
+        # Imported here because touch_calibration imports this module
+        from .touch_calibration import load_calibration, TOUCH_CALIBRATION_FILE
+        self.calibration = load_calibration(calibration_path or TOUCH_CALIBRATION_FILE)
+
+    def set_spi_speed(self, speed_hz):
+        self.spi_dev.max_speed_hz = speed_hz
 
     def is_touched(self):
         return self.irq_pin_status.is_active
@@ -51,44 +77,70 @@ class XPT2046:
                 return []
         return receive_data
     
-    def get_touch_coordinate(self):
-        avg_x = 0
-        avg_y = 0
-        n_samples = 0
-
-        for i in range(16):
-            if not self.is_touched():
-                break
-            n_samples += 1
-            response_y = self.spi_dev_transmit([READ_Y, 0x00, 0x00])
-            time.sleep(0.001)
-            response_x = self.spi_dev_transmit([READ_X, 0x00, 0x00])
-            if len(response_y) < 3 or len(response_x) < 3:
-                continue
-            y_raw_val = ((response_y[1] << 8) | response_y[2]) >> 3
-            x_raw_val = ((response_x[1] << 8) | response_x[2]) >> 3
-            avg_x += x_raw_val
-            avg_y += y_raw_val
-            time.sleep(0.001)
+    # Conversions are chained, the next command byte is sent while the last
+    # result byte is clocked out, so N conversions take 2N + 1 bytes
+    def read_channels(self, commands):
+        response = self.spi_dev_transmit(list(b for cmd in commands for b in (cmd, 0x00)) + [0x00])
+        if len(response) < 2 * len(commands) + 1:
+            return []
+        return [((response[2 * i + 1] << 8) | response[2 * i + 2]) >> 3 for i in range(len(commands))]
 
-        if n_samples == 0:
-            return False, 0, 0
+    # Return (success, raw_x, raw_y, z) from XPT2046_SAMPLES filtered samples
+    def get_raw_touch(self):
+        if not self.is_touched():
+            return False, 0, 0, 0
+        values = self.read_channels((READ_Z1, READ_Z2, READ_X, READ_Y) * XPT2046_SAMPLES)
+        samples_x = []
+        samples_y = []
+        samples_z = []
+        for i in range(0, len(values), 4):
+            z1, z2, x_raw_val, y_raw_val = values[i : i + 4]
+            z = z1 + 4095 - z2
+            if z < XPT2046_Z_THRESHOLD:
+                continue
+            samples_x.append(x_raw_val)
+            samples_y.append(y_raw_val)
+            samples_z.append(z)
 
-        raw_x = int(avg_x / n_samples)
-        raw_y = int(avg_y / n_samples)
+        # Pen lifted during the transfer or too light a touch
+        if len(samples_x) < XPT2046_MIN_VALID_SAMPLES or not self.is_touched():
+            return False, 0, 0, 0
+        return True, trimmed_mean(samples_x), trimmed_mean(samples_y), trimmed_mean(samples_z)
 
-        if raw_x < ILI9341_TOUCH_MIN_RAW_X: raw_x = ILI9341_TOUCH_MIN_RAW_X
-        if raw_x > ILI9341_TOUCH_MAX_RAW_X: raw_x = ILI9341_TOUCH_MAX_RAW_X
-        if raw_y < ILI9341_TOUCH_MIN_RAW_Y: raw_y = ILI9341_TOUCH_MIN_RAW_Y
-        if raw_y > ILI9341_TOUCH_MAX_RAW_Y: raw_y = ILI9341_TOUCH_MAX_RAW_Y
+    # Coefficients (a, b, c, d, e, f): x = a*raw_x + b*raw_y + c, y = d*raw_x + e*raw_y + f,
+    # see touch_calibration.py. None uses the ILI9341_TOUCH_*_RAW_* limits
+    def set_calibration(self, calibration):
+        self.calibration = calibration
 
-        x_calibrated = int((raw_x - ILI9341_TOUCH_MIN_RAW_X) * self.resolution_x /
-                        (ILI9341_TOUCH_MAX_RAW_X - ILI9341_TOUCH_MIN_RAW_X))
-        y_calibrated = int((raw_y - ILI9341_TOUCH_MIN_RAW_Y) * self.resolution_y /
-                        (ILI9341_TOUCH_MAX_RAW_Y - ILI9341_TOUCH_MIN_RAW_Y))
+    def raw_to_screen(self, raw_x, raw_y):
+        if self.calibration is not None:
+            a, b, c, d, e, f = self.calibration
+            x_calibrated = int(a * raw_x + b * raw_y + c)
+            y_calibrated = int(d * raw_x + e * raw_y + f)
+        else:
+            raw_x = min(max(raw_x, ILI9341_TOUCH_MIN_RAW_X), ILI9341_TOUCH_MAX_RAW_X)
+            raw_y = min(max(raw_y, ILI9341_TOUCH_MIN_RAW_Y), ILI9341_TOUCH_MAX_RAW_Y)
+            x_calibrated = int((raw_x - ILI9341_TOUCH_MIN_RAW_X) * self.resolution_x /
+                            (ILI9341_TOUCH_MAX_RAW_X - ILI9341_TOUCH_MIN_RAW_X))
+            y_calibrated = int((raw_y - ILI9341_TOUCH_MIN_RAW_Y) * self.resolution_y /
+                            (ILI9341_TOUCH_MAX_RAW_Y - ILI9341_TOUCH_MIN_RAW_Y))
+        x_calibrated = min(max(x_calibrated, 0), self.resolution_x - 1)
+        y_calibrated = min(max(y_calibrated, 0), self.resolution_y - 1)
+        return x_calibrated, y_calibrated
 
+    def get_touch_coordinate(self):
+        success, raw_x, raw_y, _ = self.get_raw_touch()
+        if not success:
+            return False, 0, 0
+        x_calibrated, y_calibrated = self.raw_to_screen(raw_x, raw_y)
         return True, x_calibrated, y_calibrated
 
+def trimmed_mean(values, trim_fraction=XPT2046_TRIM_FRACTION):
+    values = sorted(values)
+    trim = int(len(values) * trim_fraction)
+    kept = values[trim : len(values) - trim]
+    return sum(kept) / len(kept)
+
 if __name__ == "__main__":
     print(f"Read touch screen")
     IRQ_PIN = 22
@@ -96,7 +148,7 @@ if __name__ == "__main__":
     xpt2046_obj = XPT2046(320, 240, IRQ_PIN, CHIP_ID)
     try:
         while True:
-            if xpt2046_obj.is_touched:
+            if xpt2046_obj.is_touched():
                 success, x, y = xpt2046_obj.get_touch_coordinate()
                 if success:
                     print(f"X={x}, Y={y}")
@@ -9,26 +9,184 @@
 
 import time
 import datetime
+import json
+import math
+import ssl
+import struct
+
+from backends.base import create_device
+
+# Payload encodings
+PAYLOAD_JSON = "json"
+PAYLOAD_CBOR = "cbor"
+PAYLOAD_BINARY = "binary"
+
+SENSOR_UNITS = {
+    "light_level": "lx",
+    "temperature": "Cel",
+    "humid": "%RH",
+}
+
+# Batches are published when they hold this many samples or the oldest is this old
+MQTT_BATCH_SAMPLES = 6
+MQTT_BATCH_MAX_AGE = 60.0
+
+# Binary payload: header, then per sample the epoch time and one float per
+# field in the order given to PayloadBatcher. Missing values are NaN
+BINARY_PAYLOAD_VERSION = 1
+BINARY_HEADER = struct.Struct("<BBH")           # version, field count, sample count
+
+def cbor_head(major, value):
+    if value < 24:
+        return bytes((major << 5 | value,))
+    if value < 0x100:
+        return struct.pack(">BB", major << 5 | 24, value)
+    if value < 0x10000:
+        return struct.pack(">BH", major << 5 | 25, value)
+    if value < 0x100000000:
+        return struct.pack(">BI", major << 5 | 26, value)
+    return struct.pack(">BQ", major << 5 | 27, value)
+
+# Minimal CBOR (RFC 8949) encoder for None, bool, int, float, str, bytes, list and dict
+def cbor_encode(obj):
+    if obj is None:
+        return b"\xf6"
+    if obj is True:
+        return b"\xf5"
+    if obj is False:
+        return b"\xf4"
+    if isinstance(obj, int):
+        if obj >= 0:
+            return cbor_head(0, obj)
+        return cbor_head(1, -1 - obj)
+    if isinstance(obj, float):
+        # Single precision when it loses nothing, sensor values usually do not need more
+        single = struct.pack(">f", obj)
+        if math.isnan(obj) or struct.unpack(">f", single)[0] == obj:
+            return b"\xfa" + single
+        return b"\xfb" + struct.pack(">d", obj)
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+        return cbor_head(3, len(data)) + data
+    if isinstance(obj, (bytes, bytearray)):
+        return cbor_head(2, len(obj)) + bytes(obj)
+    if isinstance(obj, (list, tuple)):
+        return cbor_head(4, len(obj)) + b"".join(cbor_encode(item) for item in obj)
+    if isinstance(obj, dict):
+        return cbor_head(5, len(obj)) + b"".join(cbor_encode(key) + cbor_encode(value)
+                                                 for key, value in obj.items())
+    raise TypeError(f"Can not CBOR encode {type(obj).__name__}")
+
+# Collect samples of the given fields and encode them into one payload
+class PayloadBatcher:
+    def __init__(self, fields, encoding=PAYLOAD_JSON, max_samples=MQTT_BATCH_SAMPLES,
+                 max_age=MQTT_BATCH_MAX_AGE, units=SENSOR_UNITS):
+        if encoding not in (PAYLOAD_JSON, PAYLOAD_CBOR, PAYLOAD_BINARY):
+            raise ValueError(f"Unknown payload encoding: {encoding}")
+        self.fields = tuple(fields)
+        self.encoding = encoding
+        self.max_samples = max_samples
+        self.max_age = max_age
+        self.units = [units.get(field, "") for field in self.fields]
+        self.sample_struct = struct.Struct("<d" + "f" * len(self.fields))
+        self.samples = []
+        self.first_added = None
+
+        self.payloads = 0
+        self.payload_bytes = 0
+
+    # timestamp is epoch seconds. Return a payload when the batch is due
+    def add(self, values, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        if not self.samples:
+            self.first_added = time.monotonic()
+        self.samples.append([timestamp] + [values.get(field) for field in self.fields])
+        if self.is_due():
+            return self.flush()
+        return None
+
+    def is_due(self):
+        if not self.samples:
+            return False
+        return len(self.samples) >= self.max_samples or time.monotonic() - self.first_added >= self.max_age
+
+    # Encode and clear the batch, None if it is empty
+    def flush(self):
+        if not self.samples:
+            return None
+        payload = self.encode(self.samples)
+        self.samples = []
+        self.first_added = None
+        self.payloads += 1
+        self.payload_bytes += len(payload)
+        return payload
+
+    def encode(self, samples):
+        if self.encoding == PAYLOAD_BINARY:
+            nan = float("nan")
+            return BINARY_HEADER.pack(BINARY_PAYLOAD_VERSION, len(self.fields), len(samples)) + b"".join(
+                self.sample_struct.pack(*[nan if value is None else value for value in sample])
+                for sample in samples)
+        document = {
+            "fields": list(self.fields),
+            "units": self.units,
+            "samples": samples,     # [epoch time, value per field]
+        }
+        if self.encoding == PAYLOAD_CBOR:
+            return cbor_encode(document)
+        return json.dumps(document, separators=(",", ":")).encode("utf-8")
 
-import paho.mqtt.client as paho
-from paho import mqtt
-    
 class MQTTClient:
     def __init__(self, user, password, cluster_URL):
         self.user = user
         self.password = password
         self.cluster_URL = cluster_URL
 
-        self.mqtt_client = paho.Client(client_id="", userdata=None, protocol=paho.MQTTv5)
+        # paho client, MQTTv5
+        self.mqtt_client = create_device("mqtt")
         # Enable TLS for secure connection
-        self.mqtt_client.tls_set(tls_version=mqtt.client.ssl.PROTOCOL_TLS)
+        self.mqtt_client.tls_set(tls_version=ssl.PROTOCOL_TLS)
         # Set user and password
         self.mqtt_client.username_pw_set(self.user, self.password)
-        # Connect to cluster URL at port 8883
-        self.mqtt_client.connect(self.cluster_URL, 8883)
+
+        # With a publish queue, publish() goes through it and these callbacks
+        # are chained after the queue's own handling
+        self.publish_queue = None
+        self.connect_callback = None
+        self.publish_callback = None
+        self.mqtt_client.on_connect = self.handle_connect
+        self.mqtt_client.on_publish = self.handle_publish
+        # (channel, qos), subscribed again on every connect
+        self.subscriptions = []
+
+        # Connect to cluster URL at port 8883. The network loop started by
+        # start_thread_subscribe() connects, and keeps retrying while the
+        # uplink is down instead of raising here
+        self.mqtt_client.connect_async(self.cluster_URL, 8883)
+
+    def handle_connect(self, client, userdata, flags, rc, properties=None):
+        if rc == 0:
+            for channel, qos in self.subscriptions:
+                self.mqtt_client.subscribe(channel, qos=qos)
+        if self.publish_queue is not None:
+            self.publish_queue.connected()
+        if self.connect_callback is not None:
+            self.connect_callback(client, userdata, flags, rc, properties)
+
+    def handle_publish(self, client, userdata, mid, *args):
+        if self.publish_queue is not None:
+            self.publish_queue.acknowledge(mid)
+        if self.publish_callback is not None:
+            self.publish_callback(client, userdata, mid, *args)
+
+    # Keep publishes on disk until the broker acknowledges them, see publish_queue.py
+    def set_publish_queue(self, publish_queue):
+        self.publish_queue = publish_queue
+        publish_queue.start()
 
     def set_connect_callback(self, connect_callback):
-        self.mqtt_client.on_connect = connect_callback
+        self.connect_callback = connect_callback
 
     def set_subscribe_callback(self, subscribe_callback):
         self.mqtt_client.on_subscribe = subscribe_callback
@@ -37,13 +195,18 @@ class MQTTClient:
         self.mqtt_client.on_message = message_callback
 
     def set_publish_callback(self, publish_callback):
-        self.mqtt_client.on_publish = publish_callback
+        self.publish_callback = publish_callback
 
     def subscribe_channel(self, channel, qos):
-        self.mqtt_client.subscribe(channel, qos=qos)
+        self.subscriptions.append((channel, qos))
+        if self.mqtt_client.is_connected():
+            self.mqtt_client.subscribe(channel, qos=qos)
 
     def publish(self, topic, data, qos):
-        self.mqtt_client.publish(topic, data, qos)
+        if self.publish_queue is not None:
+            self.publish_queue.put(topic, data, qos)
+        else:
+            self.mqtt_client.publish(topic, data, qos)
 
     def start_thread_subscribe(self):
         self.mqtt_client.loop_start()
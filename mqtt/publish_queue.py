@@ -0,0 +1,343 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# publish_queue.py
+# Disk-backed outbound MQTT queue, keeps publishes through broker outages
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+
+PUBLISH_QUEUE_DIR = "mqtt_queue"
+PUBLISH_QUEUE_MAX_BYTES = 16 * 1024 * 1024
+PUBLISH_QUEUE_SEGMENT_BYTES = 1024 * 1024
+# Messages per second sent while draining a backlog
+PUBLISH_QUEUE_DRAIN_RATE = 5.0
+PUBLISH_QUEUE_MAX_IN_FLIGHT = 10
+# QoS 1 messages without PUBACK after this long are sent again
+PUBLISH_QUEUE_ACK_TIMEOUT = 60.0
+# The acknowledged position is written to disk at most this often
+PUBLISH_QUEUE_CURSOR_INTERVAL = 1.0
+
+# Record: header, topic, payload. crc covers everything after itself
+RECORD_HEADER = struct.Struct("<IIHB")          # crc, payload length, topic length, qos
+CURSOR = struct.Struct("<QQ")                   # segment number, offset
+CURSOR_FILE = "cursor"
+
+# Sent message waiting for its PUBACK. end is the queue position after it
+class InFlight:
+    def __init__(self, end, topic, payload, qos):
+        self.end = end
+        self.topic = topic
+        self.payload = payload
+        self.qos = qos
+        # Every mid it was sent with, a PUBACK for any of them delivers it
+        self.mids = []
+        self.sent_time = 0.0
+        self.is_acked = False
+
+class PublishQueue:
+    def __init__(self, client, directory=PUBLISH_QUEUE_DIR, max_bytes=PUBLISH_QUEUE_MAX_BYTES,
+                 segment_bytes=PUBLISH_QUEUE_SEGMENT_BYTES, drain_rate=PUBLISH_QUEUE_DRAIN_RATE,
+                 max_in_flight=PUBLISH_QUEUE_MAX_IN_FLIGHT, ack_timeout=PUBLISH_QUEUE_ACK_TIMEOUT):
+        # paho client, it must be connected and running its network loop
+        self.client = client
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.drain_rate = drain_rate
+        self.max_in_flight = max_in_flight
+        self.ack_timeout = ack_timeout
+
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.segments = []              # segment numbers, oldest first
+        self.segment_sizes = {}
+        self.write_file = None
+        # Everything before ack_position is delivered, send_position is the next to send
+        self.ack_position = (0, 0)
+        self.send_position = (0, 0)
+        self.cursor_dirty = False
+        self.cursor_saved = 0.0
+        self.in_flight = deque()
+        self.by_mid = {}
+        self.early_acks = set()
+
+        self.messages_queued = 0
+        self.messages_sent = 0
+        self.messages_acked = 0
+        self.messages_resent = 0
+        self.messages_evicted = 0
+
+        self.is_running = False
+        self.thread = None
+        self.open()
+
+    def segment_path(self, number):
+        return os.path.join(self.directory, f"{number:08d}.q")
+
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.segments = sorted(int(name[:-2]) for name in os.listdir(self.directory)
+                               if name.endswith(".q") and name[:-2].isdigit())
+        for number in self.segments:
+            self.segment_sizes[number] = os.path.getsize(self.segment_path(number))
+        if self.segments:
+            # A power cut can leave half a record at the end of the last segment
+            self.recover(self.segments[-1])
+        else:
+            self.segments.append(0)
+            self.segment_sizes[0] = 0
+
+        cursor_path = os.path.join(self.directory, CURSOR_FILE)
+        try:
+            with open(cursor_path, "rb") as f:
+                self.ack_position = CURSOR.unpack(f.read(CURSOR.size))
+        except (OSError, struct.error):
+            self.ack_position = (self.segments[0], 0)
+        if self.ack_position[0] < self.segments[0]:
+            self.ack_position = (self.segments[0], 0)
+        self.send_position = self.ack_position
+        self.write_file = open(self.segment_path(self.segments[-1]), "ab")
+
+    def recover(self, number):
+        path = self.segment_path(number)
+        valid = 0
+        with open(path, "rb") as f:
+            while True:
+                record = self.read_record(f)
+                if record is None:
+                    break
+                valid = f.tell()
+        if valid != self.segment_sizes[number]:
+            print(f"Publish queue - dropped {self.segment_sizes[number] - valid} torn bytes in {path}")
+            with open(path, "r+b") as f:
+                f.truncate(valid)
+            self.segment_sizes[number] = valid
+
+    # Return (topic, payload, qos) at the file position, None at the end or on a bad record
+    @staticmethod
+    def read_record(f):
+        header = f.read(RECORD_HEADER.size)
+        if len(header) < RECORD_HEADER.size:
+            return None
+        crc, payload_length, topic_length, qos = RECORD_HEADER.unpack(header)
+        data = f.read(topic_length + payload_length)
+        if len(data) < topic_length + payload_length:
+            return None
+        if zlib.crc32(header[4:] + data) != crc:
+            return None
+        return data[:topic_length].decode("utf-8"), data[topic_length:], qos
+
+    # Store the message, the drain thread sends it once the broker is reachable
+    def put(self, topic, payload, qos=1):
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        topic_bytes = topic.encode("utf-8")
+        body = struct.pack("<IHB", len(payload), len(topic_bytes), qos) + topic_bytes + payload
+        record = struct.pack("<I", zlib.crc32(body)) + body
+        with self.lock:
+            number = self.segments[-1]
+            if self.segment_sizes[number] >= self.segment_bytes:
+                number = self.rotate()
+            self.write_file.write(record)
+            self.write_file.flush()
+            os.fsync(self.write_file.fileno())
+            self.segment_sizes[number] += len(record)
+            self.messages_queued += 1
+            self.evict()
+        self.wakeup.set()
+
+    def rotate(self):
+        self.write_file.close()
+        number = self.segments[-1] + 1
+        self.segments.append(number)
+        self.segment_sizes[number] = 0
+        self.write_file = open(self.segment_path(number), "ab")
+        return number
+
+    # Drop the oldest segments, delivered or not, to stay within max_bytes
+    def evict(self):
+        while len(self.segments) > 1 and sum(self.segment_sizes.values()) > self.max_bytes:
+            number = self.segments.pop(0)
+            if self.ack_position[0] <= number:
+                self.messages_evicted += self.count_records(number, self.ack_position[1] if self.ack_position[0] == number else 0)
+                self.ack_position = (self.segments[0], 0)
+                self.cursor_dirty = True
+            if self.send_position[0] <= number:
+                self.send_position = (self.segments[0], 0)
+            while self.in_flight and self.in_flight[0].end[0] <= number:
+                entry = self.in_flight.popleft()
+                for mid in entry.mids:
+                    self.by_mid.pop(mid, None)
+            del self.segment_sizes[number]
+            os.remove(self.segment_path(number))
+
+    def count_records(self, number, offset):
+        count = 0
+        with open(self.segment_path(number), "rb") as f:
+            f.seek(offset)
+            while self.read_record(f) is not None:
+                count += 1
+        return count
+
+    def pending(self):
+        with self.lock:
+            return self.pending_bytes()
+
+    def pending_bytes(self):
+        segment, offset = self.ack_position
+        return sum(size for number, size in self.segment_sizes.items() if number >= segment) - offset
+
+    # Next unsent message as (topic, payload, qos, end position), or None
+    def next_message(self):
+        segment, offset = self.send_position
+        while True:
+            if offset < self.segment_sizes.get(segment, 0):
+                with open(self.segment_path(segment), "rb") as f:
+                    f.seek(offset)
+                    record = self.read_record(f)
+                    end = f.tell()
+                if record is not None:
+                    return record + ((segment, end),)
+            if segment == self.segments[-1]:
+                return None
+            # End of a full segment (or an unreadable tail), go on with the next one
+            segment = self.segments[self.segments.index(segment) + 1]
+            offset = 0
+
+    def send(self, entry):
+        info = self.client.publish(entry.topic, entry.payload, entry.qos)
+        if info.rc != 0:
+            return False
+        entry.sent_time = time.monotonic()
+        with self.lock:
+            entry.mids.append(info.mid)
+            self.by_mid[info.mid] = entry
+            # QoS 0 gets no PUBACK, and the PUBACK may have arrived already
+            if entry.qos == 0 or info.mid in self.early_acks:
+                self.early_acks.discard(info.mid)
+                self.mark_acked(entry)
+        return True
+
+    # Hook for the client on_publish callback
+    def acknowledge(self, mid):
+        with self.lock:
+            entry = self.by_mid.get(mid)
+            if entry is None:
+                if len(self.early_acks) > PUBLISH_QUEUE_MAX_IN_FLIGHT * 100:
+                    # Acks for messages published around the queue, not ours
+                    self.early_acks.clear()
+                self.early_acks.add(mid)
+                return
+            self.mark_acked(entry)
+        self.wakeup.set()
+
+    def mark_acked(self, entry):
+        if entry.is_acked:
+            return
+        entry.is_acked = True
+        for mid in entry.mids:
+            self.by_mid.pop(mid, None)
+        self.messages_acked += 1
+        # Acks can come out of order, the cursor only moves over a delivered prefix
+        while self.in_flight and self.in_flight[0].is_acked:
+            self.ack_position = max(self.ack_position, self.in_flight.popleft().end)
+            self.cursor_dirty = True
+        while len(self.segments) > 1 and self.ack_position[0] > self.segments[0]:
+            number = self.segments.pop(0)
+            del self.segment_sizes[number]
+            os.remove(self.segment_path(number))
+
+    def save_cursor(self, force=False):
+        with self.lock:
+            if not self.cursor_dirty:
+                return
+            now = time.monotonic()
+            if not force and now - self.cursor_saved < PUBLISH_QUEUE_CURSOR_INTERVAL:
+                return
+            position = self.ack_position
+            self.cursor_dirty = False
+            self.cursor_saved = now
+        path = os.path.join(self.directory, CURSOR_FILE)
+        with open(path + ".tmp", "wb") as f:
+            f.write(CURSOR.pack(*position))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+
+    # Hook for the client on_connect callback
+    def connected(self):
+        self.wakeup.set()
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.save_cursor(force=True)
+
+    def run(self):
+        send_interval = 1 / self.drain_rate
+        next_send = time.monotonic()
+        while self.is_running:
+            self.save_cursor()
+            if not self.client.is_connected():
+                self.wakeup.wait(1.0)
+                self.wakeup.clear()
+                continue
+
+            now = time.monotonic()
+            with self.lock:
+                timed_out = next((entry for entry in self.in_flight
+                                  if not entry.is_acked and now - entry.sent_time > self.ack_timeout), None)
+                message = None
+                if timed_out is None and len(self.in_flight) < self.max_in_flight:
+                    message = self.next_message()
+                    if message is not None:
+                        topic, payload, qos, end = message
+                        entry = InFlight(end, topic, payload, qos)
+                        self.in_flight.append(entry)
+                        self.send_position = end
+            if timed_out is None and message is None:
+                self.wakeup.wait(1.0)
+                self.wakeup.clear()
+                continue
+
+            # Pace the backlog so a reconnect does not flood the broker
+            delay = next_send - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            next_send = max(next_send + send_interval, time.monotonic())
+
+            if timed_out is not None:
+                entry = timed_out
+                self.messages_resent += 1
+            if self.send(entry):
+                self.messages_sent += 1
+            else:
+                # Link dropped between the check and the publish, retry later
+                entry.sent_time = time.monotonic() - self.ack_timeout + 1.0
+
+    def report(self):
+        print(f"Publish queue: {self.pending() / 1024:.1f} KB pending, {self.messages_queued} queued, "
+              f"{self.messages_sent} sent, {self.messages_acked} acked, {self.messages_resent} resent, "
+              f"{self.messages_evicted} evicted")
+
+    def close(self):
+        self.stop()
+        with self.lock:
+            self.write_file.close()
@@ -0,0 +1,149 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# scheduler.py
+# Run periodic tasks (sensors, actuator rules, display) at their own rates
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import heapq
+import itertools
+import threading
+import time
+
+class ScheduledTask:
+    def __init__(self, name, period, func, args):
+        self.name = name
+        self.period = period
+        self.func = func
+        self.args = args
+        self.deadline = 0.0
+        self.is_removed = False
+
+        self.runs = 0
+        self.overruns = 0           # runs that finished after the next deadline
+        self.skipped = 0            # whole periods dropped to catch up
+        self.errors = 0
+        self.max_runtime = 0.0
+        self.max_lateness = 0.0
+        self.total_runtime = 0.0
+
+class Scheduler:
+    def __init__(self):
+        self.tasks = {}
+        self.queue = []             # heap of (deadline, order, task)
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.is_running = False
+        self.thread = None
+
+    # Call func(*args) every period seconds, first run after phase seconds
+    def add_task(self, name, period, func, *args, phase=0.0):
+        task = ScheduledTask(name, period, func, args)
+        task.deadline = time.monotonic() + phase
+        with self.lock:
+            if name in self.tasks:
+                self.tasks[name].is_removed = True
+            self.tasks[name] = task
+            heapq.heappush(self.queue, (task.deadline, next(self.counter), task))
+        self.wakeup.set()
+        return task
+
+    def remove_task(self, name):
+        with self.lock:
+            task = self.tasks.pop(name, None)
+        if task is not None:
+            task.is_removed = True
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.is_running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while self.is_running:
+            with self.lock:
+                if self.queue:
+                    deadline, _, task = self.queue[0]
+                else:
+                    deadline, task = None, None
+            if task is None:
+                self.wakeup.wait()
+                self.wakeup.clear()
+                continue
+
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                # A new task may have an earlier deadline, so wake up for it
+                self.wakeup.wait(delay)
+                self.wakeup.clear()
+                continue
+
+            with self.lock:
+                heapq.heappop(self.queue)
+            if task.is_removed:
+                continue
+            self.run_task(task)
+            with self.lock:
+                if not task.is_removed:
+                    heapq.heappush(self.queue, (task.deadline, next(self.counter), task))
+
+    def run_task(self, task):
+        start = time.monotonic()
+        task.max_lateness = max(task.max_lateness, start - task.deadline)
+        try:
+            task.func(*task.args)
+        except Exception as e:
+            task.errors += 1
+            print(f"Scheduler - task {task.name} error: {e}")
+        end = time.monotonic()
+
+        runtime = end - start
+        task.runs += 1
+        task.total_runtime += runtime
+        task.max_runtime = max(task.max_runtime, runtime)
+
+        # Next deadline comes from the previous one, not from now, so the
+        # period does not drift. Periods already missed are dropped
+        task.deadline += task.period
+        if end > task.deadline:
+            task.overruns += 1
+            missed = int((end - task.deadline) / task.period) + 1
+            task.skipped += missed
+            task.deadline += missed * task.period
+
+    def report(self):
+        print("Scheduler report:")
+        with self.lock:
+            tasks = list(self.tasks.values())
+        for task in tasks:
+            mean_runtime = task.total_runtime / task.runs if task.runs else 0.0
+            print(f"  {task.name:12}: period {task.period * 1000:7.1f} ms, {task.runs} runs, "
+                  f"mean {mean_runtime * 1000:.2f} ms, max {task.max_runtime * 1000:.2f} ms, "
+                  f"max late {task.max_lateness * 1000:.2f} ms, {task.overruns} overruns, "
+                  f"{task.skipped} skipped, {task.errors} errors")
+
+
+if __name__ == "__main__":
+    def work(name, duration):
+        print(f"{time.monotonic():.3f} {name}")
+        time.sleep(duration)
+
+    scheduler = Scheduler()
+    scheduler.add_task("fast", 0.1, work, "fast", 0.01)
+    scheduler.add_task("slow", 2.0, work, "slow", 0.05)
+    scheduler.add_task("late", 0.5, work, "late", 0.7)
+    scheduler.start()
+    time.sleep(5)
+    scheduler.stop()
+    scheduler.report()
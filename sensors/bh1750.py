@@ -6,11 +6,13 @@
 # Author : Phien Nguyen (Mark)
 # Date   : 15 June 2025
 #---------------------------------------------------------------------
-import smbus
 import time
 
+from buses import i2c_bus
 
-BH1750_ADDR = 0x23 # Default device I2C address
+
+BH1750_ADDR = 0x23 # Default device I2C address, ADDR pin low
+BH1750_ADDR_HIGH = 0x5C # ADDR pin high
 POWER_DOWN = 0x00 # No active state
 POWER_ON   = 0x01 # Power on
 RESET      = 0x07 # Reset data register value
@@ -31,10 +33,59 @@ ONE_TIME_HIGH_RES_MODE_2 = 0x21
 # Device is automatically set to Power Down after measurement.
 ONE_TIME_LOW_RES_MODE = 0x23
 
+# Measurement time registers (MTreg) range, sensitivity scales with MTreg / 69
+BH1750_MTREG_DEFAULT = 69
+BH1750_MTREG_MIN = 31
+BH1750_MTREG_MAX = 254
+CHANGE_MTREG_HIGH = 0x40
+CHANGE_MTREG_LOW = 0x60
+
+# Maximum measurement time at the default MTreg, in seconds
+BH1750_LOW_RES_TIME = 0.024
+BH1750_HIGH_RES_TIME = 0.180
+
+# Adaptive range switching, with hysteresis
+BH1750_DARK_LUX_ENTER = 10
+BH1750_DARK_LUX_EXIT = 20
+BH1750_SATURATED_RAW = 0xF000
+BH1750_BRIGHT_LUX_EXIT = 40000
+
+# Use one-time modes (sensor powers down between samples) when the sample
+# period is at least this many measurement times
+BH1750_ONE_TIME_PERIOD_FACTOR = 2
+
+CONTINUOUS_TO_ONE_TIME = {
+    CONTINUOUS_LOW_RES_MODE: ONE_TIME_LOW_RES_MODE,
+    CONTINUOUS_HIGH_RES_MODE_1: ONE_TIME_HIGH_RES_MODE_1,
+    CONTINUOUS_HIGH_RES_MODE_2: ONE_TIME_HIGH_RES_MODE_2,
+}
+ONE_TIME_MODES = tuple(CONTINUOUS_TO_ONE_TIME.values())
+
+def measurement_time(mode, mtreg):
+    if mode in (CONTINUOUS_LOW_RES_MODE, ONE_TIME_LOW_RES_MODE):
+        base_time = BH1750_LOW_RES_TIME
+    else:
+        base_time = BH1750_HIGH_RES_TIME
+    return base_time * mtreg / BH1750_MTREG_DEFAULT
+
 class BH1750:
-    def __init__(self):
-        # self.bus = smbus.SMBus(0)  # Pi rev 1 use i2c-0
-        self.bus = smbus.SMBus(1)  # Pi rev 2 use i2c-1
+    # sample_period is how often read_light() will be called, it decides how
+    # slow (and precise) a measurement mode can be used
+    def __init__(self, sample_period=1.0, adaptive=True, address=BH1750_ADDR, bus=None):
+        if bus is None:
+            # bus = i2c_bus.get_bus(0)  # Pi rev 1 use i2c-0
+            bus = i2c_bus.get_bus(1)  # Pi rev 2 use i2c-1
+        self.bus = bus
+        self.address = address
+        self.sample_period = sample_period
+        self.adaptive = adaptive
+
+        self.range = "normal"       # "dark", "normal" or "bright"
+        self.mode = None            # None while powered down
+        self.mtreg = BH1750_MTREG_DEFAULT
+        self.trigger_time = 0
+        self.lux = None
+        self.raw = 0
 
     def convert_to_number(self, data):
         # Simple function to convert 2 bytes of data
@@ -43,15 +94,125 @@ class BH1750:
         result=(data[1] + (256 * data[0])) / 1.2
         return (result)
 
+    def convert_to_lux(self, data, mode, mtreg):
+        result = self.convert_to_number(data) * BH1750_MTREG_DEFAULT / mtreg
+        if mode in (CONTINUOUS_HIGH_RES_MODE_2, ONE_TIME_HIGH_RES_MODE_2):
+            result /= 2
+        return result
+
+    def set_sample_period(self, sample_period):
+        self.sample_period = sample_period
+
+    def set_mtreg(self, mtreg):
+        self.bus.write_byte(self.address, CHANGE_MTREG_HIGH | (mtreg >> 5))
+        self.bus.write_byte(self.address, CHANGE_MTREG_LOW | (mtreg & 0x1F))
+        self.mtreg = mtreg
+
+    # Pick the most sensitive (mode, MTreg) whose measurement fits the sample period
+    def choose_settings(self):
+        if self.range == "dark":
+            candidates = ((CONTINUOUS_HIGH_RES_MODE_2, BH1750_MTREG_MAX),
+                          (CONTINUOUS_HIGH_RES_MODE_2, BH1750_MTREG_DEFAULT))
+        elif self.range == "bright":
+            candidates = ((CONTINUOUS_HIGH_RES_MODE_1, BH1750_MTREG_MIN),)
+        else:
+            candidates = ((CONTINUOUS_HIGH_RES_MODE_1, BH1750_MTREG_DEFAULT),)
+        for mode, mtreg in candidates:
+            if measurement_time(mode, mtreg) <= self.sample_period:
+                break
+        else:
+            # Nothing fits, low resolution with the last candidate's MTreg
+            mode = CONTINUOUS_LOW_RES_MODE
+            mtreg = candidates[-1][1]
+
+        if self.sample_period >= BH1750_ONE_TIME_PERIOD_FACTOR * measurement_time(mode, mtreg):
+            mode = CONTINUOUS_TO_ONE_TIME[mode]
+        return mode, mtreg
+
+    def start(self, mode=None, mtreg=None):
+        if mode is None:
+            mode, mtreg = self.choose_settings()
+        self.bus.write_byte(self.address, POWER_ON)
+        if mtreg is not None and mtreg != self.mtreg:
+            self.set_mtreg(mtreg)
+        self.bus.write_byte(self.address, mode)
+        self.mode = mode
+        self.trigger_time = time.monotonic()
+
+    def power_down(self):
+        self.bus.write_byte(self.address, POWER_DOWN)
+        self.mode = None
+
+    def update_range(self):
+        if self.range == "dark" and self.lux > BH1750_DARK_LUX_EXIT:
+            self.range = "normal"
+        elif self.range == "bright" and self.lux < BH1750_BRIGHT_LUX_EXIT:
+            self.range = "normal"
+        elif self.range == "normal" and self.lux < BH1750_DARK_LUX_ENTER:
+            self.range = "dark"
+        elif self.range == "normal" and self.raw >= BH1750_SATURATED_RAW:
+            self.range = "bright"
+
+    # Never waits for a conversion except the very first one after power up.
+    # Return the latest completed measurement in lx
+    def read_light(self):
+        if self.mode is None:
+            self.start()
+            time.sleep(measurement_time(self.mode, self.mtreg))
+
+        if time.monotonic() - self.trigger_time < measurement_time(self.mode, self.mtreg):
+            return self.lux
+        lux = self.read_result()
+        mode, mtreg = self.choose_settings() if self.adaptive else (self.mode, self.mtreg)
+        if (mode, mtreg) != (self.mode, self.mtreg):
+            self.start(mode, mtreg)
+        elif self.mode in ONE_TIME_MODES:
+            # The sensor powered down after the last one, start the next
+            self.bus.write_byte(self.address, self.mode)
+            self.trigger_time = time.monotonic()
+        return lux
+
+    # Start a one-time measurement, for i2c_bus.I2CBus.read_all()
+    def trigger(self):
+        mode, mtreg = self.choose_settings()
+        self.start(CONTINUOUS_TO_ONE_TIME.get(mode, mode), mtreg)
+
+    def conversion_time(self):
+        return measurement_time(self.mode, self.mtreg)
+
+    # Plain read of the result register, no command is written so it does not
+    # start another conversion. The next one is started by the caller
+    def read_result(self):
+        try:
+            data = self.bus.read_bytes(self.address, 2)
+        except OSError as e:
+            print(f"BH1750 - read error: {e}")
+            return self.lux
+        self.raw = (data[0] << 8) | data[1]
+        self.lux = self.convert_to_lux(data, self.mode, self.mtreg)
+        if self.adaptive:
+            self.update_range()
+        return self.lux
+
+
+# Several BH1750 (e.g. one per zone) on one bus, all converting at once
+class BH1750Group:
+    def __init__(self, sensors):
+        self.sensors = list(sensors)
+        self.bus = self.sensors[0].bus
+
     def read_light(self):
-        # Read data from I2C interface
-        data = self.bus.read_i2c_block_data(BH1750_ADDR, ONE_TIME_HIGH_RES_MODE_1)
-        return self.convert_to_number(data)
+        return self.bus.read_all(self.sensors)
 
 
 if __name__=="__main__":
-    bh1750 = BH1750()
-    while True:
-        light_level = bh1750.read_light()
-        print(f"BH1750 - light level: {light_level:.1f} lx")
+    bus = i2c_bus.get_bus(1)
+    addresses = [address for address in (BH1750_ADDR, BH1750_ADDR_HIGH) if address in bus.scan()]
+    if not addresses:
+        print("BH1750 - no sensor found")
+    bh1750 = BH1750Group([BH1750(sample_period=1, address=address, bus=bus) for address in addresses])
+    while addresses:
+        light_levels = bh1750.read_light()
+        print("BH1750 - light level: " + ", ".join(f"0x{address:02X} {light_level:.1f} lx"
+                                                   for address, light_level in zip(addresses, light_levels)))
         time.sleep(1)
\ No newline at end of file
@@ -7,36 +7,102 @@
 # Date   : 15 June 2025
 #---------------------------------------------------------------------
 import time
-import board
-import adafruit_dht
+import threading
+from collections import namedtuple
 
+from backends.base import create_device
+
+# DHT11 needs at least 1s between reads, use some margin
+DHT11_MIN_INTERVAL = 2.0
+DHT11_SAMPLE_PERIOD = 2.0
+DHT11_BACKOFF_MAX = 30.0
+
+# timestamp is time.monotonic() of the acquisition
+DHTReading = namedtuple("DHTReading", ["temperature", "humidity", "timestamp"])
 
 class DHT11:
-    def __init__(self, board_pin):
-        self.dht11 = adafruit_dht.DHT11(board_pin)
+    # pin is the GPIO number, e.g. 4 for board.D4
+    def __init__(self, pin, sample_period=DHT11_SAMPLE_PERIOD):
+        self.dht11 = create_device("dht11", pin)
+        self.sample_period = max(sample_period, DHT11_MIN_INTERVAL)
+
+        self.reading = None
+        self.reads_ok = 0
+        self.reads_failed = 0
+        self.consecutive_failures = 0
+        self.last_error = None
+
+        self.stop_event = threading.Event()
+        self.thread = None
 
     def get_temperature(self):
         return self.dht11.temperature
     
     def get_humidity(self):
         return self.dht11.humidity
-    
+
+    # One acquisition for both values, raise RuntimeError on a bad read
+    def read(self):
+        self.dht11.measure()
+        temperature = self.dht11.temperature
+        humidity = self.dht11.humidity
+        if temperature is None or humidity is None:
+            raise RuntimeError("DHT11 returned no data")
+        return temperature, humidity
+
+    # Last good DHTReading, or None before the first one. Never blocks
+    def get_reading(self):
+        return self.reading
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                temperature, humidity = self.read()
+            except RuntimeError as e:
+                # Checksum and timing errors are common, retry with backoff
+                self.reads_failed += 1
+                self.consecutive_failures += 1
+                self.last_error = str(e)
+                delay = min(DHT11_MIN_INTERVAL * 2 ** (self.consecutive_failures - 1), DHT11_BACKOFF_MAX)
+            except Exception as e:
+                print(f"DHT11 - Exception: {e}")
+                self.reads_failed += 1
+                self.consecutive_failures += 1
+                self.last_error = str(e)
+                delay = DHT11_BACKOFF_MAX
+            else:
+                self.reading = DHTReading(temperature, humidity, time.monotonic())
+                self.reads_ok += 1
+                self.consecutive_failures = 0
+                delay = self.sample_period
+            self.stop_event.wait(delay)
+
 
 if __name__ == "__main__":
     # Connect dht11 to GPIO4 (pin 7)
-    dht11 = DHT11(board.D4)
+    dht11 = DHT11(4)
+    dht11.start()
     
     while True:
-        try:
-            temp = dht11.dht11.temperature
-            humid = dht11.dht11.humidity
-            if temp is not None and humid is not None:
-                print(f"DHT11 - temperature: {temp:.1f} degree, humid: {humid:.1f}%")
-            else:
-                print("Could not get temperature and humidity")
-        except RuntimeError as e:
-            print(f"RuntimeError: {e}")
-        except Exception as e:
-            print(f"Exception: {e}")       
+        reading = dht11.get_reading()
+        if reading is not None:
+            age = time.monotonic() - reading.timestamp
+            print(f"DHT11 - temperature: {reading.temperature:.1f} degree, humid: {reading.humidity:.1f}% ({age:.1f}s old)")
+        else:
+            print("Could not get temperature and humidity")
+        print(f"DHT11 - ok: {dht11.reads_ok}, failed: {dht11.reads_failed}, last error: {dht11.last_error}")
         
         time.sleep(1)
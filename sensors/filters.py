@@ -0,0 +1,127 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# filters.py
+# Smoothing, deadband and hysteresis between sensor drivers and consumers
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from collections import deque
+
+# Exponentially weighted moving average, alpha closer to 1 follows faster
+class EWMA:
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+    def reset(self):
+        self.value = None
+
+# Median of the last n values, removes single sample spikes
+class MedianFilter:
+    def __init__(self, n):
+        self.values = deque(maxlen=n)
+
+    def update(self, value):
+        self.values.append(value)
+        ordered = sorted(self.values)
+        middle = len(ordered) // 2
+        if len(ordered) % 2:
+            return ordered[middle]
+        return (ordered[middle - 1] + ordered[middle]) / 2
+
+    def reset(self):
+        self.values.clear()
+
+# Reported value only moves when the input is at least width away from it
+class Deadband:
+    def __init__(self, width):
+        self.width = width
+        self.value = None
+
+    # Return True if the reported value changed
+    def update(self, value):
+        if self.value is not None and abs(value - self.value) < self.width:
+            return False
+        self.value = value
+        return True
+
+    def reset(self):
+        self.value = None
+
+# Two thresholds: state turns on above high and back off below low.
+# With no initial state the first value decides, split at the midpoint
+class Hysteresis:
+    def __init__(self, low, high, state=None):
+        self.low = low
+        self.high = high
+        self.state = state
+
+    # Return True if the state changed
+    def update(self, value):
+        if self.state is None:
+            self.state = value > (self.low + self.high) / 2
+            return True
+        if not self.state and value > self.high:
+            self.state = True
+            return True
+        if self.state and value < self.low:
+            self.state = False
+            return True
+        return False
+
+# Runs each reading through the stages, then the deadband, and calls the
+# listeners only when the reported value changed
+class FilterPipeline:
+    def __init__(self, stages=(), deadband=0.0):
+        self.stages = list(stages)
+        self.deadband = Deadband(deadband)
+        self.listeners = []
+        self.filtered = None        # output of the stages, before the deadband
+        self.updates = 0
+        self.changes = 0
+
+    @property
+    def value(self):
+        return self.deadband.value
+
+    def add_listener(self, func):
+        self.listeners.append(func)
+
+    # Return True if a changed event was sent
+    def update(self, value):
+        self.updates += 1
+        for stage in self.stages:
+            value = stage.update(value)
+        self.filtered = value
+        if not self.deadband.update(value):
+            return False
+        self.changes += 1
+        for func in self.listeners:
+            func(value)
+        return True
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+        self.deadband.reset()
+        self.filtered = None
+
+
+if __name__ == "__main__":
+    import random
+
+    pipeline = FilterPipeline([MedianFilter(5), EWMA(0.3)], deadband=1.0)
+    pipeline.add_listener(lambda value: print(f"changed: {value:.1f}"))
+    for i in range(200):
+        level = 100 if i < 100 else 150
+        noise = random.gauss(0, 2) if random.random() > 0.05 else 500
+        pipeline.update(level + noise)
+    print(f"{pipeline.updates} updates, {pipeline.changes} changes")
@@ -10,23 +10,37 @@ import signal
 import time
 import sys
 import threading
-import board
 import datetime
 
 from lcd_touch import ili9341
 from lcd_touch import xpt2046
+from lcd_touch import text_field
+from lcd_touch import renderer
+from lcd_touch import spi_tune
+from lcd_touch import trend_chart
+from lcd_touch import screen_template
 from sensors import dht11
 from sensors import bh1750
+from sensors import filters
 from mqtt import mqtt_client
+from mqtt import publish_queue
 from actuators import led
+from buses import spi_bus
+from buses import i2c_bus
+from scheduler import Scheduler
+from storage import timeseries
+from storage import sensor_log
 
 
 is_running = True
+i2c_bus1 = None
 bh1750_sens = None
+BH1750_ADDRESS = bh1750.BH1750_ADDR
 
-# dht11 connect to GPIO4 (pin 7)
+# dht11 connect to GPIO4 (pin 7), board.D4
 dht11_sens = None
-DHT11_PIN = board.D4
+DHT11_PIN = 4
+dht11_last_reading = None
 
 # LCD ILI9341 connection
 LCD_DC_PIN_ID = 18
@@ -37,7 +51,16 @@ LCD_CHIP_ID = 0         # ILI9341 connect to CE0
 LCD_RESOLUTION_X = 320
 LCD_RESOLUTION_Y = 240
 LCD_DISPLAY_ANGLE = 0
+LCD_USE_FRAMEBUFFER = True
+spi_bus0 = None
 ili9341_lcd = None
+lcd_field_temperature = None
+lcd_field_humid = None
+lcd_field_light_level = None
+lcd_field_led_status = None
+lcd_field_time = None
+lcd_renderer = None
+lcd_trend_light_level = None
 
 # LED connect to PWM0
 LED_PWM_PIN = 0
@@ -49,101 +72,189 @@ light_level = None
 temperature = None
 humid = None
 
+# Consumers only see a change when a value moves by more than the deadband
+LIGHT_LEVEL_DEADBAND = 1.0      # lx
+TEMPERATURE_DEADBAND = 0.5      # degree C
+HUMID_DEADBAND = 1              # %
+light_level_filter = filters.FilterPipeline([filters.MedianFilter(5), filters.EWMA(0.3)], LIGHT_LEVEL_DEADBAND)
+temperature_filter = filters.FilterPipeline(deadband=TEMPERATURE_DEADBAND)
+humid_filter = filters.FilterPipeline(deadband=HUMID_DEADBAND)
+# LED turns off above 120 lx and back on below 80 lx
+LED_LIGHT_LEVEL_OFF = 120
+LED_LIGHT_LEVEL_ON = 80
+led_light_threshold = filters.Hysteresis(LED_LIGHT_LEVEL_ON, LED_LIGHT_LEVEL_OFF)
+
 mqtt_client_obj = None
+# One sample every MQTT_SAMPLE_PERIOD, the mean of the readings in that period,
+# published in batches of MQTT_BATCH_SAMPLES
+MQTT_SAMPLE_PERIOD = 10.0
+MQTT_BATCH_SAMPLES = 6
+MQTT_PAYLOAD_ENCODING = mqtt_client.PAYLOAD_JSON
+mqtt_batcher = mqtt_client.PayloadBatcher(("light_level", "temperature", "humid"), MQTT_PAYLOAD_ENCODING,
+                                          MQTT_BATCH_SAMPLES, MQTT_BATCH_SAMPLES * MQTT_SAMPLE_PERIOD)
+
+# Task periods in seconds
+LIGHT_SAMPLE_PERIOD = 0.1       # 10 Hz for the LED rule
+DHT11_SAMPLE_PERIOD = 2.0       # 0.5 Hz, DHT11 can not go much faster
+DISPLAY_REFRESH_PERIOD = 1.0
+task_scheduler = None
+sensor_history = None
+sensor_log_obj = None
+
+# Startup phases as (name, end time)
+startup_time = None
+startup_phases = []
+
+def startup_mark(phase):
+    startup_phases.append((phase, time.monotonic()))
+
+def print_startup_report():
+    print("Startup report:")
+    previous = startup_time
+    for phase, end_time in startup_phases:
+        print(f"  {phase:16}: {(end_time - previous) * 1000:7.1f} ms")
+        previous = end_time
+    print(f"  {'total':16}: {(previous - startup_time) * 1000:7.1f} ms")
+
+def make_static_screen():
+    template = screen_template.ScreenTemplate(LCD_RESOLUTION_X, LCD_RESOLUTION_Y, ili9341.ILI9341_BLACK)
+    template.add_text(0, 120, "Temperature: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    template.add_text(0, 150, "Humid: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    template.add_text(0, 180, "Light level: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    template.add_text(0, 210, "LED status: ", ili9341.font.font_11x18, ili9341.ILI9341_RED, ili9341.ILI9341_BLACK)
+
+    template.add_text(200, 120, "degree C", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    template.add_text(190, 150, "%", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    template.add_text(225, 180, "Lux", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    return template
 
 def lcd_update_temperature(value):
-    ili9341_lcd.write_string(150, 120, "    ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(150, 120, f"{value:.1f}", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_renderer.post_text(lcd_field_temperature, f"{value:.1f}")
     
 def lcd_update_humid(value):
-    ili9341_lcd.write_string(150, 150, "  ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(150, 150, f"{value}", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_renderer.post_text(lcd_field_humid, f"{value}")
     
 def lcd_update_light_level(value):
-    ili9341_lcd.write_string(150, 180, "      ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(150, 180, f"{value:.1f}", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_renderer.post_text(lcd_field_light_level, f"{value:.1f}")
 
 def lcd_update_led_status(status):
-    ili9341_lcd.write_string(150, 210, "   ", ili9341.font.font_11x18, ili9341.ILI9341_RED, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(150, 210, status, ili9341.font.font_11x18, ili9341.ILI9341_RED, ili9341.ILI9341_BLACK)
+    lcd_renderer.post_text(lcd_field_led_status, status)
 
 def lcd_update_time(time):
-    ili9341_lcd.write_string(220, 0, "   ", ili9341.font.font_11x18, ili9341.ILI9341_WHITE, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(220, 0, time, ili9341.font.font_11x18, ili9341.ILI9341_WHITE, ili9341.ILI9341_BLACK)
-
-def task_update_sensors():
-    global light_level, temperature, humid
-    lcd_light_level = 0
-    lcd_temperature = 0
-    lcd_humid = 0
-    lcd_led_status = ""
-    while is_running:
-        light_level = bh1750_sens.read_light()
-        try:
-            temperature = dht11_sens.get_temperature()
-            humid = dht11_sens.get_humidity()
-            if temperature == None:
-                temperature = lcd_temperature
-            if humid == None:
-                humid = lcd_humid
-
-        except RuntimeError as e:
-            print(f"DHT11 - RuntimeError: {e}")
-
-        except Exception as e:
-            print(f"DHT11 - Exception: {e}")  
-
-        if light_level > 100:
+    lcd_renderer.post_text(lcd_field_time, time)
+
+def task_sample_light():
+    global light_level
+    light_level = bh1750_sens.read_light()
+    now = time.time()
+    sensor_history.append("light_level", light_level, now)
+    sensor_log_obj.append("light_level", light_level, now)
+    light_level_filter.update(light_level)
+    if led_light_threshold.update(light_level_filter.filtered):
+        if led_light_threshold.state:
             led_ctrl.led_off()
         else:
             led_ctrl.led_on()
-        print(f"Light level: {light_level:.1f} lx, Temperature: {temperature:.1f} degree C, Humid: {humid}%")
-
-        if light_level != lcd_light_level:
-            lcd_update_light_level(light_level)
-            lcd_light_level = light_level
-        if temperature != lcd_temperature:
-            lcd_update_temperature(temperature)
-            lcd_temperature = temperature
-        if humid != lcd_humid:
-            lcd_update_humid(humid)
-            lcd_humid = humid
-        if led_ctrl.led_status != lcd_led_status:
-            lcd_update_led_status(led_ctrl.led_status)
-            lcd_led_status = led_ctrl.led_status
-
-        curr_time = datetime.datetime.now()
-        lcd_update_time(f"{curr_time.hour:02}:{curr_time.minute:02}:{curr_time.second:02}")
-        time.sleep(1)
+        lcd_update_led_status(led_ctrl.led_status)
+
+def task_sample_dht11():
+    global temperature, humid, dht11_last_reading
+    # Sampled on its own thread, keep the last good values until then
+    dht11_reading = dht11_sens.get_reading()
+    if dht11_reading is not None and dht11_reading is not dht11_last_reading:
+        dht11_last_reading = dht11_reading
+        temperature = dht11_reading.temperature
+        humid = dht11_reading.humidity
+        now = time.time()
+        sensor_history.append("temperature", temperature, now)
+        sensor_history.append("humid", humid, now)
+        sensor_log_obj.append("temperature", temperature, now)
+        sensor_log_obj.append("humid", humid, now)
+        temperature_filter.update(temperature)
+        humid_filter.update(humid)
+    elif temperature is None:
+        temperature = 0
+        humid = 0
+
+def task_refresh_display():
+    print(f"Light level: {light_level:.1f} lx, Temperature: {temperature:.1f} degree C, Humid: {humid}%")
+
+    lcd_trend_light_level.add(light_level_filter.filtered)
+    lcd_renderer.post(lcd_trend_light_level, lcd_trend_light_level.render)
+
+    curr_time = datetime.datetime.now()
+    lcd_update_time(f"{curr_time.hour:02}:{curr_time.minute:02}:{curr_time.second:02}")
+
+# Mean of the channel over the last MQTT sample period, None without readings
+def history_mean(name):
+    summary = sensor_history.aggregate(name, window=MQTT_SAMPLE_PERIOD)
+    return round(summary.mean, 2) if summary.count else None
 
 def task_update_mqtt():
-    while is_running:
-        if temperature is not None and humid is not None and light_level is not None:
-            curr_time = datetime.datetime.now()
-            str_mqtt = f"{curr_time.hour:02}:{curr_time.minute:02}:{curr_time.second:02} - Light level: {light_level:.1f} lx, Temperature: {temperature:.1f} degree C, Humid: {humid}%"
-            mqtt_client_obj.publish(mqtt_topic_weather, str_mqtt, 0)
-            time.sleep(10)
+    # Each sample summarizes its period rather than catching one 10 Hz reading
+    values = {name: history_mean(name) for name in mqtt_batcher.fields}
+    payload = None
+    if None not in values.values():
+        payload = mqtt_batcher.add(values)
+    # A batch that is old enough goes out even when no sample was added
+    if payload is None and mqtt_batcher.is_due():
+        payload = mqtt_batcher.flush()
+    if payload is not None:
+        mqtt_client_obj.publish(mqtt_topic_weather, payload, 1)
 
 def mqtt_message_callback(client, userdata, msg):
     print(msg.topic + " " + str(msg.qos) + " " + str(msg.payload))
 
 if __name__ == "__main__":
-    bh1750_sens = bh1750.BH1750()
-    dht11_sens = dht11.DHT11(DHT11_PIN)
+    startup_time = time.monotonic()
+    i2c_bus1 = i2c_bus.get_bus(1)
+    print("I2C devices: " + ", ".join(f"0x{address:02X}" for address in i2c_bus1.scan()))
+    bh1750_sens = bh1750.BH1750(sample_period=LIGHT_SAMPLE_PERIOD, address=BH1750_ADDRESS, bus=i2c_bus1)
+    dht11_sens = dht11.DHT11(DHT11_PIN, sample_period=DHT11_SAMPLE_PERIOD)
+    dht11_sens.start()
     led_ctrl = led.Led(LED_PWM_PIN, LED_DEFAULT_BRIGHTNESS, LED_CHIP_ID)
     led_ctrl.led_off()
+    startup_mark("sensors")
 
-    ili9341_lcd = ili9341.ILI9341(LCD_DC_PIN_ID, LCD_RESET_PIN_ID, LCD_CHIP_ID, LCD_RESOLUTION_X, LCD_RESOLUTION_Y, LCD_DISPLAY_ANGLE)
+    # SPI clock found by lcd_touch/spi_tune.py for this board, if it was run
+    spi_clock = spi_tune.load_spi_clock()
+    spi_bus0 = spi_bus.SPIBus(0)
+    ili9341_lcd = ili9341.ILI9341(LCD_DC_PIN_ID, LCD_RESET_PIN_ID, LCD_CHIP_ID, LCD_RESOLUTION_X, LCD_RESOLUTION_Y, LCD_DISPLAY_ANGLE, LCD_USE_FRAMEBUFFER,
+                                  spi_clock.get("ili9341", ili9341.ILI9341_SPI_SPEED_HZ), spi_bus0)
     ili9341_lcd.init()
-    ili9341_lcd.fill_screen(ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(0, 120, "Temperature: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(0, 150, "Humid: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(0, 180, "Light level: ", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(0, 210, "LED status: ", ili9341.font.font_11x18, ili9341.ILI9341_RED, ili9341.ILI9341_BLACK)
+    startup_mark("lcd init")
+
+    make_static_screen().show(ili9341_lcd)
+    startup_mark("static screen")
+
+    lcd_field_temperature = text_field.TextField(ili9341_lcd, 150, 120, 4, ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_field_humid = text_field.TextField(ili9341_lcd, 150, 150, 3, ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_field_light_level = text_field.TextField(ili9341_lcd, 150, 180, 6, ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    lcd_field_led_status = text_field.TextField(ili9341_lcd, 150, 210, 3, ili9341.font.font_11x18, ili9341.ILI9341_RED, ili9341.ILI9341_BLACK)
+    lcd_field_time = text_field.TextField(ili9341_lcd, 220, 0, 8, ili9341.font.font_11x18, ili9341.ILI9341_WHITE, ili9341.ILI9341_BLACK)
+    # Light level history, one column per sample
+    lcd_trend_light_level = trend_chart.TrendChart(ili9341_lcd, 0, 24, LCD_RESOLUTION_X, 88, ili9341.ILI9341_YELLOW, ili9341.ILI9341_BLACK, scale_step=50)
+    lcd_renderer = renderer.DisplayRenderer(ili9341_lcd)
+    lcd_renderer.start()
+    light_level_filter.add_listener(lcd_update_light_level)
+    temperature_filter.add_listener(lcd_update_temperature)
+    humid_filter.add_listener(lcd_update_humid)
+    lcd_update_led_status(led_ctrl.led_status)
 
-    ili9341_lcd.write_string(200, 120, "degree C", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(180, 150, "%", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
-    ili9341_lcd.write_string(225, 180, "Lux", ili9341.font.font_11x18, ili9341.ILI9341_MAGENTA, ili9341.ILI9341_BLACK)
+    # Recent readings in memory, bounded in size. MQTT samples are means over it
+    sensor_history = timeseries.TimeSeriesStore()
+    # Readings on the SD card, written back in batches by its flush thread
+    sensor_log_obj = sensor_log.SensorLog()
+    sensor_log_obj.start()
+    # Show data before connecting to the broker, which can take seconds
+    task_scheduler = Scheduler()
+    task_scheduler.add_task("light", LIGHT_SAMPLE_PERIOD, task_sample_light)
+    task_scheduler.add_task("dht11", DHT11_SAMPLE_PERIOD, task_sample_dht11)
+    # After the first light sample so the display has a value to show
+    task_scheduler.add_task("display", DISPLAY_REFRESH_PERIOD, task_refresh_display, phase=LIGHT_SAMPLE_PERIOD / 2)
+    task_scheduler.start()
+    lcd_renderer.frame_rendered.wait(5)
+    startup_mark("first data")
 
     mqtt_user = "smartnode"
     mqtt_password = "smartnode"
@@ -151,15 +262,26 @@ if __name__ == "__main__":
     mqtt_topic_weather = "weather"
     mqtt_subscribe_HiveMQ = "hiveMQ"
 
+    # Nothing connects until the network loop starts, so an uplink that is
+    # down at boot only delays delivery
     mqtt_client_obj = mqtt_client.MQTTClient(user=mqtt_user, password=mqtt_password, cluster_URL=mqtt_cluster_URL)
+    # Publishes wait on disk while the uplink is down, QoS 1 until acknowledged
+    mqtt_client_obj.set_publish_queue(publish_queue.PublishQueue(mqtt_client_obj.mqtt_client))
     mqtt_client_obj.set_message_callback(mqtt_message_callback)
     mqtt_client_obj.subscribe_channel(mqtt_subscribe_HiveMQ, 0)
     mqtt_client_obj.start_thread_subscribe()
+    startup_mark("mqtt start")
+    print_startup_report()
 
-    thread_sensor = threading.Thread(target=task_update_sensors)
-    thread_mqtt = threading.Thread(target=task_update_mqtt)
-    thread_sensor.start()
-    thread_mqtt.start()
+    task_scheduler.add_task("mqtt", MQTT_SAMPLE_PERIOD, task_update_mqtt)
 
-    while True:
-        time.sleep(100)
\ No newline at end of file
+    try:
+        while True:
+            time.sleep(100)
+    except KeyboardInterrupt:
+        pass
+    task_scheduler.stop()
+    # Continuous modes keep the BH1750 converting until it is powered down
+    bh1750_sens.power_down()
+    dht11_sens.stop()
+    sensor_log_obj.close()
\ No newline at end of file
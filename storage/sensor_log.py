@@ -0,0 +1,403 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# sensor_log.py
+# Append-only on-disk log of sensor readings, survives power loss
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import bisect
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+SENSOR_LOG_DIR = "sensor_log"
+SENSOR_LOG_CHANNELS = ("light_level", "temperature", "humid")
+
+# Segment file: header, then fixed size records. Files are preallocated
+# with zeros, so an all-zero record marks the end of the written data
+SENSOR_LOG_MAGIC = b"SLG1"
+SENSOR_LOG_VERSION = 1
+SEGMENT_HEADER = struct.Struct("<4sHHd")        # magic, version, record size, created
+RECORD = struct.Struct("<dHHf")                 # timestamp, channel, flags, value
+RECORD_CRC = struct.Struct("<I")
+RECORD_SIZE = RECORD.size + RECORD_CRC.size
+EMPTY_RECORD = bytes(RECORD_SIZE)
+
+SENSOR_LOG_SEGMENT_RECORDS = 52428              # about 1 MB per segment
+SENSOR_LOG_MAX_SEGMENTS = 64
+# One index entry every N records, a range query scans at most N extra records
+SENSOR_LOG_INDEX_INTERVAL = 256
+# Dirty pages are written back in one go, not per reading
+SENSOR_LOG_FLUSH_INTERVAL = 30.0
+
+def record_offset(index):
+    return SEGMENT_HEADER.size + index * RECORD_SIZE
+
+def pack_record(timestamp, channel, value, flags=0):
+    body = RECORD.pack(timestamp, channel, flags, value)
+    return body + RECORD_CRC.pack(zlib.crc32(body))
+
+# Return (timestamp, channel, flags, value), or None if the CRC does not match
+def unpack_record(data):
+    body = data[:RECORD.size]
+    (crc,) = RECORD_CRC.unpack_from(data, RECORD.size)
+    if zlib.crc32(body) != crc:
+        return None
+    return RECORD.unpack(body)
+
+class Segment:
+    def __init__(self, path, number, capacity):
+        self.path = path
+        self.number = number
+        self.capacity = capacity
+        self.count = 0
+        self.first_time = None
+        self.last_time = None
+        # Sparse index: timestamps of records 0, N, 2N, ...
+        self.index_times = []
+        self.mmap = None
+        self.file = None
+
+    @property
+    def is_full(self):
+        return self.count >= self.capacity
+
+    def create(self):
+        size = record_offset(self.capacity)
+        with open(self.path, "wb") as f:
+            f.write(SEGMENT_HEADER.pack(SENSOR_LOG_MAGIC, SENSOR_LOG_VERSION, RECORD_SIZE, time.time()))
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def open(self, writable):
+        self.file = open(self.path, "r+b" if writable else "rb")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self.mmap = mmap.mmap(self.file.fileno(), 0, access=access)
+        magic, version, record_size, _ = SEGMENT_HEADER.unpack_from(self.mmap, 0)
+        if magic != SENSOR_LOG_MAGIC or version != SENSOR_LOG_VERSION or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"{self.path} is not a sensor log segment")
+        self.capacity = (len(self.mmap) - SEGMENT_HEADER.size) // RECORD_SIZE
+
+    def close(self):
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def record_bytes(self, index):
+        offset = record_offset(index)
+        return self.mmap[offset : offset + RECORD_SIZE]
+
+    def record_time(self, index):
+        return struct.unpack_from("<d", self.mmap, record_offset(index))[0]
+
+    def note_record(self, index, timestamp):
+        if index % SENSOR_LOG_INDEX_INTERVAL == 0:
+            self.index_times.append(timestamp)
+        if self.first_time is None:
+            self.first_time = timestamp
+        self.last_time = timestamp
+
+    # Check every record, stop at the first empty or torn one and zero the
+    # rest so later appends start from clean space. Return records dropped
+    def recover(self):
+        self.count = 0
+        self.index_times = []
+        self.first_time = None
+        self.last_time = None
+        for index in range(self.capacity):
+            data = self.record_bytes(index)
+            if data == EMPTY_RECORD:
+                break
+            record = unpack_record(data)
+            if record is None:
+                break
+            self.note_record(index, record[0])
+            self.count += 1
+
+        dropped = 0
+        tail_start = record_offset(self.count)
+        tail_end = record_offset(self.capacity)
+        if self.mmap[tail_start:tail_end].count(0) != tail_end - tail_start:
+            for index in range(self.count, self.capacity):
+                if self.record_bytes(index) != EMPTY_RECORD:
+                    dropped += 1
+            self.mmap[tail_start:tail_end] = bytes(tail_end - tail_start)
+            self.mmap.flush()
+        return dropped
+
+    # Closed segments were completed before, find the end by binary search
+    # on empty records and read only the timestamps needed for the index
+    def load_closed(self):
+        low, high = 0, self.capacity
+        while low < high:
+            mid = (low + high) // 2
+            if self.record_bytes(mid) == EMPTY_RECORD:
+                high = mid
+            else:
+                low = mid + 1
+        self.count = low
+        self.index_times = [self.record_time(index) for index in range(0, self.count, SENSOR_LOG_INDEX_INTERVAL)]
+        if self.count:
+            self.first_time = self.record_time(0)
+            self.last_time = self.record_time(self.count - 1)
+
+    def append(self, record_data, timestamp):
+        offset = record_offset(self.count)
+        self.mmap[offset : offset + RECORD_SIZE] = record_data
+        self.note_record(self.count, timestamp)
+        self.count += 1
+
+    # Records with start_time <= timestamp < end_time among the first count
+    # records. Reads through its own read-only mapping of the file, so it
+    # does not touch the writer's mmap and works on a snapshot of count/index
+    def read_range(self, start_time, end_time, count, index_times):
+        block = max(bisect.bisect_right(index_times, start_time) - 1, 0)
+        index = block * SENSOR_LOG_INDEX_INTERVAL
+        records = []
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            # Removed by retention after the snapshot was taken
+            return records
+        with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            while index < count:
+                offset = record_offset(index)
+                record = unpack_record(buffer[offset : offset + RECORD_SIZE])
+                index += 1
+                if record is None:
+                    continue
+                if record[0] >= end_time:
+                    break
+                if record[0] >= start_time:
+                    records.append(record)
+        return records
+
+class SensorLog:
+    def __init__(self, directory=SENSOR_LOG_DIR, channels=SENSOR_LOG_CHANNELS,
+                 segment_records=SENSOR_LOG_SEGMENT_RECORDS, max_segments=SENSOR_LOG_MAX_SEGMENTS,
+                 flush_interval=SENSOR_LOG_FLUSH_INTERVAL):
+        self.directory = directory
+        self.channels = tuple(channels)
+        self.channel_ids = {name: channel_id for channel_id, name in enumerate(self.channels)}
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self.flush_interval = flush_interval
+
+        # append() only ever holds self.lock for memory work. msync, file
+        # creation and removal happen on the flush thread under flush_lock
+        self.lock = threading.Lock()
+        self.flush_lock = threading.RLock()
+        self.flush_event = threading.Event()
+        self.segments = []
+        self.active = None
+        self.next_number = 0
+        # Preallocated segment taken over by append() when the active one is full
+        self.spare = None
+        # Segments waiting for the flush thread: full ones to msync and close,
+        # expired ones to delete
+        self.retired = []
+        self.expired = []
+        self.sync_rotations = 0
+        self.time_steps = 0
+        self.records_written = 0
+        self.records_dropped = 0
+        self.flushes = 0
+        self.is_dirty = False
+
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.open()
+
+    def segment_path(self, number):
+        return os.path.join(self.directory, f"{number:08d}.seg")
+
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        numbers = sorted(int(name[:-4]) for name in os.listdir(self.directory)
+                         if name.endswith(".seg") and name[:-4].isdigit())
+        if numbers:
+            self.next_number = numbers[-1] + 1
+        for number in numbers:
+            segment = Segment(self.segment_path(number), number, self.segment_records)
+            try:
+                segment.open(writable=(number == numbers[-1]))
+            except ValueError as e:
+                print(f"Sensor log - {e}")
+                continue
+            if number == numbers[-1]:
+                # Only the last segment can hold a torn record, or the one
+                # before it when the last is an unused spare
+                self.records_dropped += segment.recover()
+                if segment.count == 0 and self.segments:
+                    previous = self.segments[-1]
+                    previous.open(writable=True)
+                    self.records_dropped += previous.recover()
+                    if not previous.is_full:
+                        # Carry on in it and keep the empty one as the spare
+                        self.active = previous
+                        self.spare = segment
+                        continue
+                    previous.close()
+                self.active = segment
+            else:
+                segment.load_closed()
+                segment.close()
+            self.segments.append(segment)
+        if self.records_dropped:
+            print(f"Sensor log - dropped {self.records_dropped} torn records")
+        if self.active is None or self.active.is_full:
+            self.rotate(self.create_segment())
+        self.process_segments()
+
+    def create_segment(self):
+        with self.lock:
+            number = self.next_number
+            self.next_number += 1
+        segment = Segment(self.segment_path(number), number, self.segment_records)
+        segment.create()
+        segment.open(writable=True)
+        return segment
+
+    # Called with self.lock held (or before the log is shared), memory only
+    def rotate(self, segment):
+        if self.active is not None:
+            self.retired.append(self.active)
+        self.segments.append(segment)
+        self.active = segment
+        while len(self.segments) > self.max_segments:
+            self.expired.append(self.segments.pop(0))
+
+    # Goes to the page cache only, the flush thread writes it back
+    def append(self, channel, value, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        record_data = pack_record(timestamp, self.channel_ids[channel], value)
+        with self.lock:
+            # Records in a segment must be in time order for its index. When
+            # the clock steps back (NTP after boot, no RTC) a new segment starts
+            is_time_step = self.active.last_time is not None and timestamp < self.active.last_time
+            if self.active.is_full or is_time_step:
+                if is_time_step:
+                    self.time_steps += 1
+                spare = self.spare
+                self.spare = None
+                if spare is None:
+                    # The flush thread fell behind, the caller pays for one file creation
+                    self.sync_rotations += 1
+                    self.lock.release()
+                    try:
+                        spare = self.create_segment()
+                    finally:
+                        self.lock.acquire()
+                self.rotate(spare)
+                self.flush_event.set()
+            self.active.append(record_data, timestamp)
+            self.records_written += 1
+            self.is_dirty = True
+
+    # msync outside self.lock: appends keep going into the page cache meanwhile
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                active = self.active
+                is_dirty = self.is_dirty
+                self.is_dirty = False
+            if is_dirty:
+                active.mmap.flush()
+                self.flushes += 1
+            self.process_segments()
+
+    # Close retired segments, delete expired ones and preallocate the next spare
+    def process_segments(self):
+        with self.flush_lock:
+            with self.lock:
+                retired, self.retired = self.retired, []
+                expired, self.expired = self.expired, []
+                need_spare = self.spare is None
+            for segment in retired:
+                segment.mmap.flush()
+                segment.close()
+            for segment in expired:
+                segment.close()
+                os.remove(segment.path)
+            if need_spare:
+                spare = self.create_segment()
+                with self.lock:
+                    self.spare = spare
+
+    # List of (timestamp, channel, value) with start_time <= timestamp < end_time,
+    # optionally only for one channel
+    def query(self, start_time, end_time, channel=None):
+        channel_id = None if channel is None else self.channel_ids[channel]
+        # Snapshot under the lock, scan the files without it
+        with self.lock:
+            snapshot = [(segment, segment.count, list(segment.index_times)) for segment in self.segments
+                        if segment.count and segment.first_time < end_time and segment.last_time >= start_time]
+        results = []
+        for segment, count, index_times in snapshot:
+            for timestamp, record_channel, _, value in segment.read_range(start_time, end_time, count, index_times):
+                if channel_id is None or record_channel == channel_id:
+                    results.append((timestamp, self.channels[record_channel], value))
+        return results
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            # Woken early by a rotation, to prepare the next spare segment
+            if self.flush_event.wait(self.flush_interval):
+                self.flush_event.clear()
+                self.process_segments()
+            else:
+                self.flush()
+
+    def close(self):
+        self.stop()
+        with self.flush_lock, self.lock:
+            for segment in self.segments:
+                segment.close()
+            if self.spare is not None:
+                self.spare.close()
+                os.remove(self.spare.path)
+                self.spare = None
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        log = SensorLog(directory, segment_records=10000)
+        now = time.time()
+        start = time.perf_counter()
+        for i in range(100000):
+            log.append("light_level", i * 0.5, now + i)
+        elapsed = time.perf_counter() - start
+        log.flush()
+        print(f"100000 appends in {elapsed * 1000:.1f} ms, {len(log.segments)} segments")
+
+        start = time.perf_counter()
+        records = log.query(now + 50000, now + 50100, "light_level")
+        elapsed = time.perf_counter() - start
+        print(f"query returned {len(records)} records in {elapsed * 1000:.2f} ms")
+        log.close()
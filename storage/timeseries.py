@@ -0,0 +1,263 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# timeseries.py
+# In-memory sensor history, fixed size ring buffers with downsampled tiers
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import math
+import threading
+import time
+from array import array
+from collections import namedtuple
+
+# Raw samples kept per channel (1 hour at 10 Hz)
+TIMESERIES_RAW_CAPACITY = 36000
+# Downsampled tiers as (bucket seconds, number of buckets)
+TIMESERIES_TIERS = (
+    (10.0, 8640),       # 1 day
+    (60.0, 10080),      # 1 week
+)
+
+# Backward clock jitter up to this many seconds is clamped, a larger step
+# back (NTP correcting a Pi with no RTC) starts a new epoch
+TIMESERIES_CLOCK_TOLERANCE = 1.0
+
+# count is the number of raw samples behind the aggregate
+Aggregate = namedtuple("Aggregate", ["count", "min", "max", "mean", "last"])
+
+class RingBuffer:
+    # Each column is a preallocated array, timestamps are 'd' and the
+    # other columns use typecode
+    def __init__(self, capacity, columns, typecode='f'):
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.columns = {name: array(typecode, [0]) * capacity for name in columns}
+        self.head = 0           # next slot to write
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def append(self, timestamp, **values):
+        self.timestamps[self.head] = timestamp
+        for name, value in values.items():
+            self.columns[name][self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    # Physical slot of the i-th oldest entry
+    def slot(self, i):
+        return (self.head - self.count + i) % self.capacity
+
+    # First logical index with timestamp >= t, timestamps are increasing
+    def bisect(self, t):
+        low, high = 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            if self.timestamps[self.slot(mid)] < t:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def oldest_time(self):
+        return self.timestamps[self.slot(0)] if self.count else None
+
+    # Slots of the entries with start_time <= timestamp < end_time, oldest first
+    def slots(self, start_time=None, end_time=None):
+        first = 0 if start_time is None else self.bisect(start_time)
+        last = self.count if end_time is None else self.bisect(end_time)
+        return [self.slot(i) for i in range(first, last)]
+
+    def last(self, name):
+        if not self.count:
+            return None
+        slot = self.slot(self.count - 1)
+        return self.timestamps[slot], self.columns[name][slot]
+
+class DownsampleTier:
+    def __init__(self, bucket_seconds, capacity):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = RingBuffer(capacity, ("min", "max", "mean", "count"))
+        # Bucket being filled, as [start, min, max, sum, count]
+        self.current = None
+
+    def add(self, timestamp, value):
+        bucket_start = timestamp - timestamp % self.bucket_seconds
+        current = self.current
+        if current is not None and current[0] != bucket_start:
+            self.close_bucket()
+            current = None
+        if current is None:
+            self.current = [bucket_start, value, value, value, 1]
+            return
+        if value < current[1]:
+            current[1] = value
+        if value > current[2]:
+            current[2] = value
+        current[3] += value
+        current[4] += 1
+
+    def close_bucket(self):
+        start, minimum, maximum, total, count = self.current
+        self.buckets.append(start, min=minimum, max=maximum, mean=total / count, count=count)
+        self.current = None
+
+    def clear(self):
+        self.buckets.clear()
+        self.current = None
+
+    def oldest_time(self):
+        if len(self.buckets):
+            return self.buckets.oldest_time()
+        return self.current[0] if self.current is not None else None
+
+    # Buckets (including the open one) that start inside [start_time, end_time)
+    def rows(self, start_time, end_time):
+        columns = self.buckets.columns
+        rows = [(columns["min"][slot], columns["max"][slot], columns["mean"][slot], columns["count"][slot])
+                for slot in self.buckets.slots(start_time, end_time)]
+        current = self.current
+        if current is not None and start_time <= current[0] < end_time:
+            rows.append((current[1], current[2], current[3] / current[4], current[4]))
+        return rows
+
+class TimeSeries:
+    def __init__(self, name, raw_capacity=TIMESERIES_RAW_CAPACITY, tiers=TIMESERIES_TIERS):
+        self.name = name
+        self.raw = RingBuffer(raw_capacity, ("value",))
+        self.tiers = [DownsampleTier(bucket_seconds, capacity) for bucket_seconds, capacity in tiers]
+        self.epochs = 0
+
+    # Timestamps must not go backwards, the bisect and the tier buckets rely on it
+    def append(self, value, timestamp):
+        last = self.raw.last("value")
+        if last is not None and timestamp < last[0]:
+            if last[0] - timestamp <= TIMESERIES_CLOCK_TOLERANCE:
+                timestamp = last[0]
+            else:
+                # The history was stamped with a clock that has since been
+                # corrected, it can not be ordered against new samples
+                self.raw.clear()
+                for tier in self.tiers:
+                    tier.clear()
+                self.epochs += 1
+        self.raw.append(timestamp, value=value)
+        for tier in self.tiers:
+            tier.add(timestamp, value)
+
+    def last(self):
+        return self.raw.last("value")
+
+    # Raw (timestamp, value) pairs in [start_time, end_time)
+    def samples(self, start_time=None, end_time=None):
+        values = self.raw.columns["value"]
+        return [(self.raw.timestamps[slot], values[slot]) for slot in self.raw.slots(start_time, end_time)]
+
+    def aggregate(self, start_time, end_time):
+        last = self.raw.last("value")
+        last_value = last[1] if last is not None else None
+
+        # Raw data while it still covers the window, then the finest tier that does
+        oldest = self.raw.oldest_time()
+        if oldest is not None and oldest <= start_time:
+            values = self.raw.columns["value"]
+            window = [values[slot] for slot in self.raw.slots(start_time, end_time)]
+            if not window:
+                return Aggregate(0, None, None, None, last_value)
+            return Aggregate(len(window), min(window), max(window), math.fsum(window) / len(window), last_value)
+
+        tier = self.tiers[-1] if self.tiers else None
+        for candidate in self.tiers:
+            candidate_oldest = candidate.oldest_time()
+            if candidate_oldest is not None and candidate_oldest <= start_time:
+                tier = candidate
+                break
+        if tier is None:
+            return Aggregate(0, None, None, None, last_value)
+        # Buckets are aligned to bucket_seconds, so the window widens to whole buckets
+        aligned_start = start_time - start_time % tier.bucket_seconds
+        rows = tier.rows(aligned_start, end_time)
+        if not rows:
+            return Aggregate(0, None, None, None, last_value)
+        count = sum(row[3] for row in rows)
+        mean = math.fsum(row[2] * row[3] for row in rows) / count
+        return Aggregate(int(count), min(row[0] for row in rows), max(row[1] for row in rows), mean, last_value)
+
+    def memory_bytes(self):
+        buffers = [self.raw] + [tier.buckets for tier in self.tiers]
+        return sum(buffer.timestamps.itemsize * buffer.capacity +
+                   sum(column.itemsize * buffer.capacity for column in buffer.columns.values())
+                   for buffer in buffers)
+
+class TimeSeriesStore:
+    def __init__(self, raw_capacity=TIMESERIES_RAW_CAPACITY, tiers=TIMESERIES_TIERS):
+        self.raw_capacity = raw_capacity
+        self.tiers = tiers
+        self.channels = {}
+        self.lock = threading.Lock()
+
+    def add_channel(self, name, raw_capacity=None, tiers=None):
+        with self.lock:
+            if name not in self.channels:
+                self.channels[name] = TimeSeries(name,
+                                                 self.raw_capacity if raw_capacity is None else raw_capacity,
+                                                 self.tiers if tiers is None else tiers)
+            return self.channels[name]
+
+    # O(1), timestamp is epoch seconds. A step back in the clock drops the channel history
+    def append(self, name, value, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        with self.lock:
+            channel = self.channels.get(name)
+            if channel is None:
+                channel = self.channels[name] = TimeSeries(name, self.raw_capacity, self.tiers)
+            channel.append(value, timestamp)
+
+    def last(self, name):
+        with self.lock:
+            channel = self.channels.get(name)
+            return channel.last() if channel is not None else None
+
+    def samples(self, name, start_time=None, end_time=None):
+        with self.lock:
+            channel = self.channels.get(name)
+            return channel.samples(start_time, end_time) if channel is not None else []
+
+    # Aggregate over the last window seconds, or over [start_time, end_time)
+    def aggregate(self, name, window=None, start_time=None, end_time=None):
+        if end_time is None:
+            end_time = time.time()
+        if start_time is None:
+            start_time = end_time - window
+        with self.lock:
+            channel = self.channels.get(name)
+            if channel is None:
+                return Aggregate(0, None, None, None, None)
+            return channel.aggregate(start_time, end_time)
+
+    def memory_bytes(self):
+        with self.lock:
+            return sum(channel.memory_bytes() for channel in self.channels.values())
+
+
+if __name__ == "__main__":
+    import random
+
+    store = TimeSeriesStore()
+    now = time.time()
+    start = time.perf_counter()
+    for i in range(100000):
+        store.append("light_level", random.uniform(0, 500), now - 100000 + i)
+    elapsed = time.perf_counter() - start
+    print(f"100000 appends in {elapsed * 1000:.1f} ms, {store.memory_bytes() / 1024:.0f} KB per channel")
+    for window in (60, 3600, 86400):
+        print(f"last {window} s: {store.aggregate('light_level', window)}")
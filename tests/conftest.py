@@ -0,0 +1,12 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# conftest.py
+# Makes the top level packages importable when pytest is run as "pytest"
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,62 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# test_backends.py
+# Backend devices against the protocols in backends.base
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from typing import Protocol
+
+import pytest
+
+from backends import base
+from backends import hardware
+from backends import simulated
+
+# Arguments create_device() is given for each kind
+DEVICE_ARGS = {
+    "i2c": (1,),
+    "spi": (0, 0),
+    "gpio_out": (18,),
+    "gpio_in": (22, True),
+    "pwm": (0, 1000, 0),
+    "dht11": (4,),
+    "mqtt": (),
+}
+
+# Methods and attributes of a protocol, including those of its bases
+def protocol_members(protocol):
+    members = set()
+    for cls in protocol.__mro__:
+        if cls in (Protocol, object) or Protocol not in cls.__mro__:
+            continue
+        members.update(getattr(cls, "__annotations__", {}))
+        members.update(name for name, value in vars(cls).items() if callable(value) and not name.startswith("_"))
+    return members
+
+def test_every_kind_has_args():
+    assert set(DEVICE_ARGS) == set(base.DEVICE_KINDS)
+
+@pytest.mark.parametrize("kind", base.DEVICE_KINDS)
+def test_simulated_device_follows_protocol(kind):
+    factory = base.registry[(simulated.BACKEND_NAME, kind)]
+    device = factory(*DEVICE_ARGS[kind])
+    protocol = base.DEVICE_PROTOCOLS[kind]
+    missing = sorted(name for name in protocol_members(protocol) if not hasattr(device, name))
+    assert missing == []
+    assert isinstance(device, protocol)
+
+def test_hardware_backend_registers_every_kind():
+    assert all((hardware.BACKEND_NAME, kind) in base.registry for kind in base.DEVICE_KINDS)
+
+# The one hardware device that is not a library object
+def test_hardware_i2c_follows_protocol():
+    methods = protocol_members(base.I2CBus)
+    assert all(callable(getattr(hardware.HardwareI2C, name, None)) for name in methods)
+
+def test_missing_member_is_detected():
+    class IncompleteOutput:
+        def on(self):
+            pass
+    assert not isinstance(IncompleteOutput(), base.DigitalOutput)
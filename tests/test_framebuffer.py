@@ -0,0 +1,84 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# test_framebuffer.py
+# Dirty rectangle tracking and merging of lcd_touch.framebuffer
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+from lcd_touch.framebuffer import FrameBuffer, FRAMEBUFFER_BLOCK_PIXELS, FRAMEBUFFER_MERGE_GAP
+
+WIDTH = 64
+HEIGHT = 16
+BLOCK = FRAMEBUFFER_BLOCK_PIXELS
+
+def synced_framebuffer():
+    framebuffer = FrameBuffer(WIDTH, HEIGHT)
+    framebuffer.mark_synced()
+    return framebuffer
+
+# Every changed pixel must be inside one of the rectangles
+def covers(rects, framebuffer):
+    for row in range(HEIGHT):
+        for column in range(WIDTH):
+            start = row * framebuffer.stride + column * 2
+            if framebuffer.buffer[start : start + 2] == framebuffer.shadow[start : start + 2]:
+                continue
+            if not any(x <= column < x + w and y <= row < y + h for x, y, w, h in rects):
+                return False
+    return True
+
+def test_unsynced_sends_whole_screen():
+    framebuffer = FrameBuffer(WIDTH, HEIGHT)
+    assert framebuffer.dirty_rectangles() == [(0, 0, WIDTH, HEIGHT)]
+
+def test_no_changes_no_rectangles():
+    framebuffer = synced_framebuffer()
+    framebuffer.fill_rectangle(0, 0, WIDTH, HEIGHT, 0x0000)
+    assert framebuffer.dirty_rectangles() == []
+
+def test_change_is_rounded_to_blocks():
+    framebuffer = synced_framebuffer()
+    framebuffer.fill_rectangle(BLOCK + 1, 3, 2, 2, 0xFFFF)
+    assert framebuffer.dirty_rectangles() == [(BLOCK, 3, BLOCK, 2)]
+
+def test_blocks_within_merge_gap_are_merged():
+    framebuffer = synced_framebuffer()
+    gap = FRAMEBUFFER_MERGE_GAP * BLOCK
+    framebuffer.fill_rectangle(0, 0, 1, 1, 0xFFFF)
+    framebuffer.fill_rectangle(BLOCK + gap, 0, 1, 1, 0xFFFF)
+    assert framebuffer.dirty_rectangles() == [(0, 0, 2 * BLOCK + gap, 1)]
+
+def test_blocks_beyond_merge_gap_stay_apart():
+    framebuffer = synced_framebuffer()
+    gap = (FRAMEBUFFER_MERGE_GAP + 1) * BLOCK
+    framebuffer.fill_rectangle(0, 0, 1, 1, 0xFFFF)
+    framebuffer.fill_rectangle(BLOCK + gap, 0, 1, 1, 0xFFFF)
+    assert sorted(framebuffer.dirty_rectangles()) == [(0, 0, BLOCK, 1), (BLOCK + gap, 0, BLOCK, 1)]
+
+def test_overlapping_rows_are_merged_vertically():
+    framebuffer = synced_framebuffer()
+    framebuffer.fill_rectangle(0, 2, BLOCK, 3, 0xFFFF)
+    framebuffer.fill_rectangle(BLOCK // 2, 5, BLOCK * 2, 2, 0xFFFF)
+    assert framebuffer.dirty_rectangles() == [(0, 2, 3 * BLOCK, 5)]
+
+def test_separated_regions_give_separate_rectangles():
+    framebuffer = synced_framebuffer()
+    framebuffer.fill_rectangle(0, 0, 4, 2, 0xFFFF)
+    framebuffer.fill_rectangle(WIDTH - 4, HEIGHT - 2, 4, 2, 0xFFFF)
+    rects = framebuffer.dirty_rectangles()
+    assert len(rects) == 2
+    assert covers(rects, framebuffer)
+
+def test_mark_synced_clears_changes():
+    framebuffer = synced_framebuffer()
+    framebuffer.fill_rectangle(10, 10, 5, 5, 0xF800)
+    assert framebuffer.dirty_rectangles()
+    framebuffer.mark_synced()
+    assert framebuffer.dirty_rectangles() == []
+
+def test_scattered_changes_are_covered():
+    framebuffer = synced_framebuffer()
+    for x, y in ((3, 0), (20, 1), (40, 1), (63, 7), (0, 15), (33, 9), (34, 10)):
+        framebuffer.fill_rectangle(x, y, 1, 1, 0x07E0)
+    assert covers(framebuffer.dirty_rectangles(), framebuffer)
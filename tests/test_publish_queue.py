@@ -0,0 +1,157 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# test_publish_queue.py
+# Cursor, eviction, recovery and PUBACK handling of mqtt.publish_queue
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import os
+import threading
+import time
+from collections import namedtuple
+
+from mqtt.publish_queue import PublishQueue
+
+PublishInfo = namedtuple("PublishInfo", ["rc", "mid"])
+
+# Stands in for the paho client, records publishes and never acks by itself
+class FakeClient:
+    def __init__(self, connected=True):
+        self.connected = connected
+        self.published = []
+        self.next_mid = 1
+        self.lock = threading.Lock()
+        self.on_publish = None
+
+    def is_connected(self):
+        return self.connected
+
+    def publish(self, topic, payload, qos):
+        with self.lock:
+            mid = self.next_mid
+            self.next_mid += 1
+            self.published.append((mid, topic, payload))
+        if self.on_publish is not None:
+            self.on_publish(mid)
+        return PublishInfo(0, mid)
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+def make_queue(directory, client, **kwargs):
+    kwargs.setdefault("drain_rate", 1000.0)
+    return PublishQueue(client, str(directory), **kwargs)
+
+def segment_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".q"))
+
+def test_out_of_order_ack_moves_cursor_over_delivered_prefix(tmp_path):
+    client = FakeClient()
+    queue = make_queue(tmp_path, client)
+    for i in range(3):
+        queue.put("weather", f"message {i}")
+    total = queue.pending()
+    queue.start()
+    wait_for(lambda: len(client.published) == 3)
+    mids = [mid for mid, _, _ in client.published]
+
+    queue.acknowledge(mids[2])
+    assert queue.pending() == total
+    queue.acknowledge(mids[0])
+    first_done = queue.pending()
+    assert 0 < first_done < total
+    queue.acknowledge(mids[1])
+    assert queue.pending() == 0
+    assert queue.messages_acked == 3
+    queue.close()
+
+def test_ack_before_publish_returns(tmp_path):
+    client = FakeClient()
+    queue = make_queue(tmp_path, client)
+    # The PUBACK arrives on the network thread before publish() has returned
+    client.on_publish = queue.acknowledge
+    queue.put("weather", "early")
+    queue.start()
+    wait_for(lambda: queue.pending() == 0)
+    assert queue.messages_acked == 1
+    assert not queue.early_acks
+    queue.close()
+
+def test_unacked_message_is_resent_and_any_mid_delivers_it(tmp_path):
+    client = FakeClient()
+    queue = make_queue(tmp_path, client, ack_timeout=0.05)
+    queue.put("weather", "slow")
+    queue.start()
+    wait_for(lambda: queue.messages_resent >= 1)
+    first_mid = client.published[0][0]
+    queue.acknowledge(first_mid)
+    assert queue.pending() == 0
+    queue.close()
+    assert all(payload == b"slow" for _, _, payload in client.published)
+
+def test_cursor_survives_restart(tmp_path):
+    client = FakeClient()
+    queue = make_queue(tmp_path, client)
+    for i in range(3):
+        queue.put("weather", f"message {i}")
+    queue.start()
+    wait_for(lambda: len(client.published) == 3)
+    queue.acknowledge(client.published[0][0])
+    queue.acknowledge(client.published[1][0])
+    queue.close()
+
+    queue = make_queue(tmp_path, FakeClient(connected=False))
+    topic, payload, qos, _ = queue.next_message()
+    assert (topic, payload, qos) == ("weather", b"message 2", 1)
+    queue.close()
+
+def test_torn_tail_is_truncated(tmp_path):
+    queue = make_queue(tmp_path, FakeClient(connected=False))
+    queue.put("weather", "one")
+    queue.put("weather", "two")
+    path = queue.segment_path(queue.segments[-1])
+    size = os.path.getsize(path)
+    queue.close()
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03\x04\x05")
+
+    queue = make_queue(tmp_path, FakeClient(connected=False))
+    assert os.path.getsize(path) == size
+    assert queue.pending() == size
+    queue.put("weather", "three")
+    assert queue.next_message()[1] == b"one"
+    queue.close()
+
+def test_eviction_drops_oldest_segments(tmp_path):
+    queue = make_queue(tmp_path, FakeClient(connected=False), segment_bytes=100, max_bytes=300)
+    payload = "x" * 40
+    for _ in range(30):
+        queue.put("weather", payload)
+    assert queue.messages_evicted > 0
+    assert queue.pending() <= 300
+    assert len(segment_files(str(tmp_path))) == len(queue.segments)
+    # Sending starts at the oldest message still on disk
+    assert queue.send_position == (queue.segments[0], 0)
+    assert queue.next_message()[1] == payload.encode()
+    kept = sum(queue.count_records(number, 0) for number in queue.segments)
+    assert queue.messages_evicted + kept == 30
+    queue.close()
+
+def test_acked_segments_are_removed(tmp_path):
+    client = FakeClient()
+    queue = make_queue(tmp_path, client, segment_bytes=100)
+    for i in range(10):
+        queue.put("weather", f"message {i:02d}" + "x" * 30)
+    assert len(queue.segments) > 2
+    queue.start()
+    wait_for(lambda: len(client.published) == 10)
+    for mid, _, _ in client.published:
+        queue.acknowledge(mid)
+    assert queue.pending() == 0
+    assert segment_files(str(tmp_path)) == [os.path.basename(queue.segment_path(queue.segments[-1]))]
+    queue.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# test_sensor_log.py
+# Recovery after power loss, retention and time steps of storage.sensor_log
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import os
+
+from storage.sensor_log import SensorLog, record_offset, RECORD_SIZE
+
+START_TIME = 1800000000.0
+
+def fill(log, count, start_time=START_TIME, channel="light_level"):
+    for i in range(count):
+        log.append(channel, float(i), start_time + i)
+
+# Power loss: the mappings go away but nothing is tidied up, the spare stays
+def crash(log):
+    log.flush()
+    for segment in log.segments:
+        segment.close()
+    if log.spare is not None:
+        log.spare.close()
+
+def segment_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(".seg"))
+
+def corrupt(path, index, length=4):
+    with open(path, "r+b") as f:
+        f.seek(record_offset(index) + RECORD_SIZE - length)
+        f.write(b"\xff" * length)
+
+def test_records_survive_reopen(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=100)
+    fill(log, 50)
+    log.close()
+
+    log = SensorLog(str(tmp_path), segment_records=100)
+    records = log.query(START_TIME, START_TIME + 50)
+    assert [value for _, _, value in records] == [float(i) for i in range(50)]
+    assert log.records_dropped == 0
+    log.close()
+
+def test_torn_record_is_dropped(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=100)
+    fill(log, 10)
+    path = log.active.path
+    crash(log)
+    corrupt(path, 9)
+
+    log = SensorLog(str(tmp_path), segment_records=100)
+    assert log.records_dropped == 1
+    assert len(log.query(START_TIME, START_TIME + 100)) == 9
+    # Appends carry on where the valid records end
+    log.append("temperature", 21.0, START_TIME + 20)
+    assert log.active.count == 10
+    assert log.query(START_TIME + 20, START_TIME + 21) == [(START_TIME + 20, "temperature", 21.0)]
+    log.close()
+
+def test_records_after_a_tear_are_dropped(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=100)
+    fill(log, 10)
+    path = log.active.path
+    crash(log)
+    corrupt(path, 5)
+
+    log = SensorLog(str(tmp_path), segment_records=100)
+    assert log.records_dropped == 5
+    assert len(log.query(START_TIME, START_TIME + 100)) == 5
+    log.close()
+
+def test_torn_record_before_unused_spare(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=100)
+    fill(log, 10)
+    path = log.active.path
+    spare_path = log.spare.path
+    crash(log)
+    corrupt(path, 9)
+
+    log = SensorLog(str(tmp_path), segment_records=100)
+    assert log.records_dropped == 1
+    assert log.active.path == path
+    assert log.spare.path == spare_path
+    assert len(log.query(START_TIME, START_TIME + 100)) == 9
+    log.close()
+
+def test_oldest_segments_are_removed(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=10, max_segments=3)
+    fill(log, 60)
+    log.flush()
+    # Three kept segments and the preallocated spare
+    assert len(segment_files(str(tmp_path))) == 4
+    records = log.query(START_TIME, START_TIME + 60)
+    assert [value for _, _, value in records] == [float(i) for i in range(30, 60)]
+    log.close()
+    assert len(segment_files(str(tmp_path))) == 3
+
+def test_clock_step_back_starts_new_segment(tmp_path):
+    log = SensorLog(str(tmp_path), segment_records=100)
+    fill(log, 10)
+    first = log.active
+    fill(log, 10, start_time=START_TIME - 3600)
+    assert log.time_steps == 1
+    assert log.active is not first
+    assert len(log.query(START_TIME, START_TIME + 10)) == 10
+    assert len(log.query(START_TIME - 3600, START_TIME - 3590)) == 10
+    log.close()
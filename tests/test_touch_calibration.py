@@ -0,0 +1,49 @@
+#!/usr/bin/python
+#---------------------------------------------------------------------
+# test_touch_calibration.py
+# Affine touch calibration saved, loaded by XPT2046 and applied
+#
+# Author : Phien Nguyen (Mark)
+# Date   : 18 October 2026
+#---------------------------------------------------------------------
+import pytest
+
+from backends import base
+from lcd_touch import touch_calibration
+from lcd_touch.xpt2046 import XPT2046
+
+RAW_POINTS = ((3600.0, 3300.0), (1800.0, 2100.0), (2500.0, 900.0))
+SCREEN_POINTS = ((32, 24), (288, 120), (160, 216))
+
+@pytest.fixture(autouse=True)
+def simulated_backend():
+    previous = base.backend_name
+    base.set_backend("simulated")
+    yield
+    base.set_backend(previous)
+
+def make_touch(path):
+    return XPT2046(320, 240, 22, 1, calibration_path=str(path))
+
+def test_saved_calibration_is_applied_after_restart(tmp_path):
+    path = tmp_path / "touch_calibration.json"
+    calibration = touch_calibration.compute_affine(RAW_POINTS, SCREEN_POINTS)
+    touch_calibration.save_calibration(calibration, str(path))
+    assert touch_calibration.load_calibration(str(path)) == pytest.approx(calibration)
+
+    touch = make_touch(path)
+    assert touch.calibration == pytest.approx(calibration)
+    for (raw_x, raw_y), (x, y) in zip(RAW_POINTS, SCREEN_POINTS):
+        screen_x, screen_y = touch.raw_to_screen(raw_x, raw_y)
+        assert abs(screen_x - x) <= 1
+        assert abs(screen_y - y) <= 1
+
+def test_missing_file_leaves_touch_uncalibrated(tmp_path):
+    touch = make_touch(tmp_path / "missing.json")
+    assert touch.calibration is None
+    assert touch.raw_to_screen(0, 0) == (0, 0)
+
+def test_bad_file_leaves_touch_uncalibrated(tmp_path):
+    path = tmp_path / "touch_calibration.json"
+    path.write_text('{"xpt2046": [1, 2, 3]}')
+    assert make_touch(path).calibration is None